@@ -1,9 +1,12 @@
 from typing import Optional
 import datetime
+import os
+import json
 import typer
 from pathlib import Path
-from functools import wraps
-from rich.console import Console
+from functools import lru_cache, wraps
+from contextlib import contextmanager, nullcontext
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.live import Live
@@ -14,8 +17,12 @@ from rich.text import Text
 from rich.live import Live
 from rich.table import Table
 from collections import deque
+from itertools import islice
+from bisect import bisect_left
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from rich.tree import Tree
 from rich import box
 from rich.align import Align
@@ -23,7 +30,6 @@ from rich.rule import Rule
 from dotenv import load_dotenv
 load_dotenv()
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
@@ -37,33 +43,106 @@ app = typer.Typer(
 )
 
 
+# Agents shown in the progress panel, grouped by team
+TEAMS = {
+    "Analyst Team": [
+        "Market Analyst",
+        "Social Analyst",
+        "News Analyst",
+        "Fundamentals Analyst",
+    ],
+    "Research Team": ["Bull Researcher", "Bear Researcher", "Research Manager"],
+    "Trading Team": ["Trader"],
+    "Risk Management": ["Risky Analyst", "Neutral Analyst", "Safe Analyst"],
+    "Portfolio Management": ["Portfolio Manager"],
+}
+
+ANALYST_SECTIONS = ("market_report", "sentiment_report", "news_report", "fundamentals_report")
+
+SECTION_TITLES = {
+    "market_report": "Market Analysis",
+    "sentiment_report": "Social Sentiment",
+    "news_report": "News Analysis",
+    "fundamentals_report": "Fundamentals Analysis",
+    "investment_plan": "Research Team Decision",
+    "trader_investment_plan": "Trading Team Plan",
+    "final_trade_decision": "Portfolio Management Decision",
+}
+
+# Agent roster in display order; MessageBuffer stores statuses by roster index
+AGENT_NAMES = tuple(agent for agents in TEAMS.values() for agent in agents)
+AGENT_IDS = {agent: index for index, agent in enumerate(AGENT_NAMES)}
+
+# Progress table rows as (team label, agent, roster index, last row of its team)
+PROGRESS_ROWS = tuple(
+    (team if position == 0 else "", agent, AGENT_IDS[agent], position == len(agents) - 1)
+    for team, agents in TEAMS.items()
+    for position, agent in enumerate(agents)
+)
+
+# box.SIMPLE_HEAD with a row separator, drawn by Rich between table sections
+PROGRESS_BOX = box.Box(
+    "    \n"
+    "    \n"
+    " ── \n"
+    "    \n"
+    " ── \n"
+    "    \n"
+    "    \n"
+    "    \n"
+)
+
+STATUS_PENDING, STATUS_IN_PROGRESS, STATUS_COMPLETED, STATUS_ERROR = range(4)
+STATUS_IDS = {
+    "pending": STATUS_PENDING,
+    "in_progress": STATUS_IN_PROGRESS,
+    "completed": STATUS_COMPLETED,
+    "error": STATUS_ERROR,
+}
+
+# Status cells by status code; immutable renderables shared by every row and frame
+SHARED_SPINNER = Spinner("dots", text="[blue]in_progress[/blue]", style="bold cyan")
+STATUS_CELLS = (
+    Text("pending", style="yellow"),
+    SHARED_SPINNER,
+    Text("completed", style="green"),
+    Text("error", style="red"),
+)
+
+
+# Number of messages shown in the messages panel (increased from 8 to better fill the space)
+MAX_DISPLAY_MESSAGES = 12
+
+
 # Create a deque to store recent messages with a maximum length
 class MessageBuffer:
-    def __init__(self, max_length=100):
-        self.messages = deque(maxlen=max_length)
-        self.tool_calls = deque(maxlen=max_length)
+    def __init__(self, max_length=MAX_DISPLAY_MESSAGES):
+        # Messages and tool calls in arrival order, as (timestamp, type, display Text);
+        # tool calls use type "Tool". Only what the panel can show is kept; the
+        # full history goes to the run's log file.
+        self.timeline = deque(maxlen=max_length)
+        self.timeline_count = 0  # Total entries ever added
+        self._last_ts_sec = None
+        self._last_ts_str = None
+        self.tool_call_count = 0
+        self.llm_call_count = 0
+        self.reports_count = 0
         self.current_report = None
-        self.final_report = None  # Store the complete final report
-        self.agent_status = {
-            # Analyst Team
-            "Market Analyst": "pending",
-            "Social Analyst": "pending",
-            "News Analyst": "pending",
-            "Fundamentals Analyst": "pending",
-            # Research Team
-            "Bull Researcher": "pending",
-            "Bear Researcher": "pending",
-            "Research Manager": "pending",
-            # Trading Team
-            "Trader": "pending",
-            # Risk Management Team
-            "Risky Analyst": "pending",
-            "Neutral Analyst": "pending",
-            "Safe Analyst": "pending",
-            # Portfolio Management Team
-            "Portfolio Manager": "pending",
-        }
+        self.current_report_md = None
+        self._final_report = None  # Complete final report, rebuilt lazily on read
+        self._final_dirty = False
+        self._rendered_blocks = {}  # section name -> final report markdown block
+        self._latest_section = None  # Most recently updated report section
+        self._debate_messages = {}  # debate speaker -> last response added, see add_debate_message
+        # Status code per agent, indexed like AGENT_NAMES
+        self.agent_status = [STATUS_PENDING] * len(AGENT_NAMES)
         self.current_agent = None
+        self.log_fh = None  # Buffered run log (binary), see run_log
+        self._log_pending = []  # Log text queued by write_log
+        self.report_dir = None  # Where flush_report_sections saves <section>.md files
+        self._unsaved_sections = set()
+        self._saved_sections = {}  # section name -> content last written to disk
+        self._log_flushed_at = 0.0
         self.report_sections = {
             "market_report": None,
             "sentiment_report": None,
@@ -73,111 +152,242 @@ class MessageBuffer:
             "trader_investment_plan": None,
             "final_trade_decision": None,
         }
+        # Display regions that changed since update_display last rebuilt them
+        self._dirty = {"progress": True, "messages": True, "report": True, "footer": True}
+
+    def mark_dirty(self, *regions):
+        """Flag display regions for rebuild (all regions if none are given)."""
+        for region in regions or self._dirty:
+            self._dirty[region] = True
+
+    def is_dirty(self, region):
+        return self._dirty[region]
+
+    def consume_dirty(self, region):
+        """Return whether a region needs rebuilding and clear its flag."""
+        dirty = self._dirty[region]
+        self._dirty[region] = False
+        return dirty
+
+    def reset_reports(self):
+        for section in self.report_sections:
+            self.report_sections[section] = None
+        self.reports_count = 0
+        self.current_report = None
+        self.current_report_md = None
+        self._latest_section = None
+        self._rendered_blocks.clear()
+        self._final_dirty = True
+        self._debate_messages.clear()
+        self.mark_dirty("report", "footer")
 
     def _format_report_content(self, content):
         """Ensures content is a string."""
         return str(content)
 
+    def write_log(self, text):
+        """Queue text for the run log; it is written in one batch by flush_log."""
+        self._log_pending.append(text)
+
+    def flush_log(self, min_interval=1.0):
+        """Write and flush queued log text if min_interval seconds passed since the last flush."""
+        if self.log_fh is None:
+            return
+        now = time.monotonic()
+        if now - self._log_flushed_at >= min_interval:
+            if self._log_pending:
+                self.log_fh.write("".join(self._log_pending).encode("utf-8"))
+                self._log_pending.clear()
+            self.log_fh.flush()
+            self._log_flushed_at = now
+
+    @contextmanager
+    def run_log(self, log_fh):
+        """Send the run log to log_fh within the block; queued text is flushed on exit."""
+        self.log_fh = log_fh
+        try:
+            yield log_fh
+        finally:
+            self.flush_log(min_interval=0)
+            self.log_fh = None
+
+    def _timestamp(self):
+        """HH:MM:SS for now; formatted at most once per second."""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._last_ts_str
+
     def add_message(self, message_type, content):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.messages.append((timestamp, message_type, content))
+        timestamp = self._timestamp()
+        # Normalize and truncate once here rather than on every display refresh
+        content_str = extract_content_string(content)
+        if len(content_str) > 200:
+            content_str = content_str[:197] + "..."
+        # Word-wrapped cell built once; reused on every refresh while it is shown
+        self.timeline.append((timestamp, message_type, Text(content_str, overflow="fold")))
+        self.timeline_count += 1
+        if message_type == "Reasoning":
+            self.llm_call_count += 1
+        self.mark_dirty("messages", "footer")
+
+    def add_debate_message(self, speaker, content):
+        """Add a debate speaker's latest response, skipping a repeat of the last one.
+
+        Streamed chunks carry the full debate state, so the same response is
+        seen again on every chunk until the speaker's next turn.
+        """
+        if self._debate_messages.get(speaker) != content:
+            self._debate_messages[speaker] = content
+            self.add_message("Reasoning", content)
 
     def add_tool_call(self, tool_name, args):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.tool_calls.append((timestamp, tool_name, args))
+        timestamp = self._timestamp()
+        # Truncate tool call args if too long
+        if isinstance(args, str) and len(args) > 100:
+            args = args[:97] + "..."
+        self.timeline.append((timestamp, "Tool", Text(f"{tool_name}: {args}", overflow="fold")))
+        self.timeline_count += 1
+        self.tool_call_count += 1
+        self.mark_dirty("messages", "footer")
 
     def update_agent_status(self, agent, status):
-        if agent in self.agent_status:
-            self.agent_status[agent] = status
+        index = AGENT_IDS.get(agent)
+        if index is not None:
+            code = STATUS_IDS[status]
+            if self.agent_status[index] != code:
+                self.mark_dirty("progress")
+            self.agent_status[index] = code
             self.current_agent = agent
 
+    def set_all_statuses(self, status):
+        """Set every agent to status in one step (one progress rebuild)."""
+        code = STATUS_IDS[status]
+        if self.agent_status.count(code) != len(self.agent_status):
+            self.agent_status[:] = [code] * len(self.agent_status)
+            self.mark_dirty("progress")
+        self.current_agent = AGENT_NAMES[-1]
+
     def update_report_section(self, section_name, content):
-        if section_name in self.report_sections:
+        # Full-state chunks re-send unchanged sections; nothing to redo for those
+        if section_name in self.report_sections and self.report_sections[section_name] != content:
+            # Count sections as they go from empty to generated (and back)
+            self.reports_count += (content is not None) - (self.report_sections[section_name] is not None)
             self.report_sections[section_name] = content
+            if content is not None:
+                self._latest_section = section_name
+            self._render_section_block(section_name, content)
+            self._final_dirty = True
+            if self.report_dir is not None:
+                self._unsaved_sections.add(section_name)
             self._update_current_report()
+            self.mark_dirty("report", "footer")
+
+    def flush_report_sections(self):
+        """Write changed report sections to report_dir, replacing each file atomically.
+
+        Sections are coalesced between flushes, and content identical to what is
+        already on disk is not rewritten.
+        """
+        for section_name in self._unsaved_sections:
+            content = self.report_sections[section_name]
+            if not content or self._saved_sections.get(section_name) == content:
+                continue
+            path = os.path.join(self.report_dir, f"{section_name}.md")
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(str(content))
+            os.replace(tmp_path, path)
+            self._saved_sections[section_name] = content
+        self._unsaved_sections.clear()
+
+    @property
+    def final_report(self):
+        """Complete report of all sections, rebuilt only after a section changed."""
+        if self._final_dirty:
+            self._update_final_report()
+            self._final_dirty = False
+        return self._final_report
 
     def _update_current_report(self):
         # For the panel display, only show the most recently updated section
-        latest_section = None
+        latest_section = self._latest_section
         latest_content = None
+        if latest_section:
+            latest_content = self._format_report_content(self.report_sections[latest_section])
 
-        # Find the most recently updated section
-        for section, content in self.report_sections.items():
-            if content is not None:
-                latest_section = section
-                latest_content = self._format_report_content(content)
-               
         if latest_section and latest_content:
             # Format the current section for display
-            section_titles = {
-                "market_report": "Market Analysis",
-                "sentiment_report": "Social Sentiment",
-                "news_report": "News Analysis",
-                "fundamentals_report": "Fundamentals Analysis",
-                "investment_plan": "Research Team Decision",
-                "trader_investment_plan": "Trading Team Plan",
-                "final_trade_decision": "Portfolio Management Decision",
-            }
-            self.current_report = (
-                f"### {section_titles[latest_section]}\n{latest_content}"
-            )
-
-        # Update the final complete report
-        self._update_final_report()
+            current_report = f"### {SECTION_TITLES[latest_section]}\n{latest_content}"
+            if current_report != self.current_report:
+                self.current_report = current_report
+                # Parse once per change; the display reuses it on every refresh
+                self.current_report_md = Markdown(current_report)
+
+    def _render_section_block(self, section_name, content):
+        """Pre-render the final report block for one section (dropped when empty)."""
+        if not content:
+            self._rendered_blocks.pop(section_name, None)
+            return
+        body = self._format_report_content(content)
+        if section_name in ANALYST_SECTIONS:
+            # Analyst reports are grouped under one team heading
+            self._rendered_blocks[section_name] = f"### {SECTION_TITLES[section_name]}\n{body}"
+        else:
+            self._rendered_blocks[section_name] = f"## {SECTION_TITLES[section_name]}\n\n{body}"
 
     def _update_final_report(self):
         report_parts = []
 
         # Analyst Team Reports
-        if any(
-            self.report_sections[section]
-            for section in [
-                "market_report",
-                "sentiment_report",
-                "news_report",
-                "fundamentals_report",
-            ]
-        ):
+        analyst_blocks = [
+            self._rendered_blocks[section]
+            for section in ANALYST_SECTIONS
+            if section in self._rendered_blocks
+        ]
+        if analyst_blocks:
             report_parts.append("## Analyst Team Reports")
-            if self.report_sections["market_report"]:
-                report_parts.append(
-                    f"### Market Analysis\n{self._format_report_content(self.report_sections['market_report'])}"
-                )
-            if self.report_sections["sentiment_report"]:
-                report_parts.append(
-                    f"### Social Sentiment\n{self._format_report_content(self.report_sections['sentiment_report'])}"
-                )
-            if self.report_sections["news_report"]:
-                report_parts.append(
-                    f"### News Analysis\n{self._format_report_content(self.report_sections['news_report'])}"
-                )
-            if self.report_sections["fundamentals_report"]:
-                report_parts.append(
-                    f"### Fundamentals Analysis\n{self._format_report_content(self.report_sections['fundamentals_report'])}"
-                )
-
-        # Research Team Reports
-        if self.report_sections["investment_plan"]:
-            report_parts.append("## Research Team Decision")
-            report_parts.append(f"{self._format_report_content(self.report_sections['investment_plan'])}")
+            report_parts.extend(analyst_blocks)
 
-        # Trading Team Reports
-        if self.report_sections["trader_investment_plan"]:
-            report_parts.append("## Trading Team Plan")
-            report_parts.append(f"{self._format_report_content(self.report_sections['trader_investment_plan'])}")
+        # Research, Trading and Portfolio Management decisions
+        for section in self.report_sections:
+            if section not in ANALYST_SECTIONS and section in self._rendered_blocks:
+                report_parts.append(self._rendered_blocks[section])
 
-        # Portfolio Management Decision
-        if self.report_sections["final_trade_decision"]:
-            report_parts.append("## Portfolio Management Decision")
-            report_parts.append(f"{self._format_report_content(self.report_sections['final_trade_decision'])}")
+        self._final_report = "\n\n".join(report_parts) if report_parts else None
 
-        self.final_report = "\n\n".join(report_parts) if report_parts else None
+message_buffer = MessageBuffer()
 
+# The header never changes; build it once
+HEADER_PANEL = Panel(
+    "[bold green]Welcome to TradingAgents CLI[/bold green]\n"
+    "[dim]© [Tauric Research](https://github.com/TauricResearch)[/dim]",
+    title="Welcome to TradingAgents",
+    border_style="green",
+    padding=(1, 2),
+    expand=True,
+)
 
-message_buffer = MessageBuffer()
+# Spinner row text shown in the messages panel by the last update_display call
+_displayed_spinner_text = None
+# Live repaints of the layout per second
+_LIVE_REFRESH_PER_SECOND = 1
+# Minimum seconds between display rebuilds (TA_DISPLAY_INTERVAL), and when the last one happened.
+# Capped at one Live frame: skipped updates are drawn by the next refresh anyway.
+_MIN_RENDER_INTERVAL = min(float(os.getenv("TA_DISPLAY_INTERVAL", "0.25")), 1 / _LIVE_REFRESH_PER_SECOND)
+_last_render = 0.0
+# Spinner text of the latest update_display call skipped by the interval check
+# (a 1-tuple), rendered by flush_pending_display on the next Live refresh
+_pending_update = None
+# update_display runs on the main thread and, via flush_pending_display, on Live's refresh thread
+_DISPLAY_LOCK = threading.RLock()
+# (tool calls, LLM calls, reports) shown in the current footer panel
+_footer_key = None
 
 
 def create_layout():
+    global _footer_key
     layout = Layout()
     layout.split_column(
         Layout(name="header", size=3),
@@ -190,28 +400,70 @@ def create_layout():
     layout["upper"].split_row(
         Layout(name="progress", ratio=2), Layout(name="messages", ratio=3)
     )
+    layout["header"].update(HEADER_PANEL)
+    # A fresh layout has no panels yet
+    _footer_key = None
+    message_buffer.mark_dirty()
     return layout
 
 
-def update_display(layout, spinner_text=None):
-    # Header with welcome message
-    layout["header"].update(
-        Panel(
-            "[bold green]Welcome to TradingAgents CLI[/bold green]\n"
-            "[dim]© [Tauric Research](https://github.com/TauricResearch)[/dim]",
-            title="Welcome to TradingAgents",
-            border_style="green",
-            padding=(1, 2),
-            expand=True,
-        )
-    )
+def update_display(layout, spinner_text=None, force=False):
+    """Refresh the changed panels of the live layout.
+
+    Bursts of updates are coalesced: unless forced (or an agent's status changed),
+    calls within _MIN_RENDER_INTERVAL of the last render are skipped. Skipped
+    changes stay flagged dirty and are rendered by flush_pending_display on the
+    next Live refresh, or by the next update_display call if that comes first.
+    """
+    global _displayed_spinner_text, _last_render, _pending_update
+    with _DISPLAY_LOCK:
+        message_buffer.flush_log(0.0 if force else 1.0)
+        now = time.monotonic()
+        if (
+            not force
+            and not message_buffer.is_dirty("progress")
+            and now - _last_render < _MIN_RENDER_INTERVAL
+        ):
+            _pending_update = (spinner_text,)
+            return
+        _last_render = now
+        _pending_update = None
+        message_buffer.flush_report_sections()
+
+        # Only rebuild the regions whose underlying data changed; the layout keeps
+        # the previous renderables (spinners keep animating on Live refresh).
+        if message_buffer.consume_dirty("progress"):
+            _update_progress_panel(layout)
+        if message_buffer.consume_dirty("messages") or spinner_text != _displayed_spinner_text:
+            _displayed_spinner_text = spinner_text
+            _update_messages_panel(layout, spinner_text)
+        if message_buffer.consume_dirty("report"):
+            _update_report_panel(layout)
+        if message_buffer.consume_dirty("footer"):
+            _update_footer_panel(layout)
+
+
+def flush_pending_display(layout):
+    """Live's get_renderable hook: render an update skipped by update_display.
+
+    The stream loop may block on an LLM call for many seconds right after a
+    skipped update; this makes the skipped changes appear on the next Live refresh.
+    """
+    with _DISPLAY_LOCK:
+        pending = _pending_update
+        if pending is not None:
+            update_display(layout, pending[0], force=True)
+    return layout
 
+
+def _update_progress_panel(layout):
     # Progress panel showing agent status
     progress_table = Table(
         show_header=True,
         header_style="bold magenta",
         show_footer=False,
-        box=box.SIMPLE_HEAD,  # Use simple header with horizontal lines
+        box=PROGRESS_BOX,  # Simple header, plus horizontal lines between team sections
+        border_style="dim",
         title=None,  # Remove the redundant Progress title
         padding=(0, 2),  # Add horizontal padding
         expand=True,  # Make table expand to fill available space
@@ -220,62 +472,19 @@ def update_display(layout, spinner_text=None):
     progress_table.add_column("Agent", style="green", justify="center", width=20)
     progress_table.add_column("Status", style="yellow", justify="center", width=20)
 
-    # Group agents by team
-    teams = {
-        "Analyst Team": [
-            "Market Analyst",
-            "Social Analyst",
-            "News Analyst",
-            "Fundamentals Analyst",
-        ],
-        "Research Team": ["Bull Researcher", "Bear Researcher", "Research Manager"],
-        "Trading Team": ["Trader"],
-        "Risk Management": ["Risky Analyst", "Neutral Analyst", "Safe Analyst"],
-        "Portfolio Management": ["Portfolio Manager"],
-    }
-
-    for team, agents in teams.items():
-        # Add first agent with team name
-        first_agent = agents[0]
-        status = message_buffer.agent_status[first_agent]
-        if status == "in_progress":
-            spinner = Spinner(
-                "dots", text="[blue]in_progress[/blue]", style="bold cyan"
-            )
-            status_cell = spinner
-        else:
-            status_color = {
-                "pending": "yellow",
-                "completed": "green",
-                "error": "red",
-            }.get(status, "white")
-            status_cell = f"[{status_color}]{status}[/{status_color}]"
-        progress_table.add_row(team, first_agent, status_cell)
-
-        # Add remaining agents in team
-        for agent in agents[1:]:
-            status = message_buffer.agent_status[agent]
-            if status == "in_progress":
-                spinner = Spinner(
-                    "dots", text="[blue]in_progress[/blue]", style="bold cyan"
-                )
-                status_cell = spinner
-            else:
-                status_color = {
-                    "pending": "yellow",
-                    "completed": "green",
-                    "error": "red",
-                }.get(status, "white")
-                status_cell = f"[{status_color}]{status}[/{status_color}]"
-            progress_table.add_row("", agent, status_cell)
-
-        # Add horizontal line after each team
-        progress_table.add_row("─" * 20, "─" * 20, "─" * 20, style="dim")
+    agent_status = message_buffer.agent_status
+    for team, agent, index, end_of_team in PROGRESS_ROWS:
+        # Team name is shown on the first agent's row only; a section ends each team
+        progress_table.add_row(
+            team, agent, STATUS_CELLS[agent_status[index]], end_section=end_of_team
+        )
 
     layout["progress"].update(
         Panel(progress_table, title="Progress", border_style="cyan", padding=(1, 2))
     )
 
+
+def _update_messages_panel(layout, spinner_text):
     # Messages panel showing recent messages and tool calls
     messages_table = Table(
         show_header=True,
@@ -292,63 +501,22 @@ def update_display(layout, spinner_text=None):
         "Content", style="white", no_wrap=False, ratio=1
     )  # Make content column expand
 
-    # Combine tool calls and messages
-    all_messages = []
+    max_messages = MAX_DISPLAY_MESSAGES
 
-    # Add tool calls
-    for timestamp, tool_name, args in message_buffer.tool_calls:
-        # Truncate tool call args if too long
-        if isinstance(args, str) and len(args) > 100:
-            args = args[:97] + "..."
-        all_messages.append((timestamp, "Tool", f"{tool_name}: {args}"))
-
-    # Add regular messages
-    for timestamp, msg_type, content in message_buffer.messages:
-        # Convert content to string if it's not already
-        content_str = content
-        if isinstance(content, list):
-            # Handle list of content blocks (Anthropic format)
-            text_parts = []
-            for item in content:
-                if isinstance(item, dict):
-                    if item.get('type') == 'text':
-                        text_parts.append(item.get('text', ''))
-                    elif item.get('type') == 'tool_use':
-                        text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
-                else:
-                    text_parts.append(str(item))
-            content_str = ' '.join(text_parts)
-        elif not isinstance(content_str, str):
-            content_str = str(content)
-            
-        # Truncate message content if too long
-        if len(content_str) > 200:
-            content_str = content_str[:197] + "..."
-        all_messages.append((timestamp, msg_type, content_str))
+    # The timeline is already in arrival order and holds display-ready cells
+    recent_messages = list(islice(reversed(message_buffer.timeline), max_messages))
 
-    # Sort by timestamp
-    all_messages.sort(key=lambda x: x[0])
-
-    # Calculate how many messages we can show based on available space
-    # Start with a reasonable number and adjust based on content length
-    max_messages = 12  # Increased from 8 to better fill the space
-
-    # Get the last N messages that will fit in the panel
-    recent_messages = all_messages[-max_messages:]
-
-    # Add messages to table
-    for timestamp, msg_type, content in recent_messages:
-        # Format content with word wrapping
-        wrapped_content = Text(content, overflow="fold")
+    # Add messages to table, oldest first
+    for timestamp, msg_type, wrapped_content in reversed(recent_messages):
         messages_table.add_row(timestamp, msg_type, wrapped_content)
 
     if spinner_text:
         messages_table.add_row("", "Spinner", spinner_text)
 
     # Add a footer to indicate if messages were truncated
-    if len(all_messages) > max_messages:
+    if message_buffer.timeline_count > max_messages:
         messages_table.footer = (
-            f"[dim]Showing last {max_messages} of {len(all_messages)} messages[/dim]"
+            f"[dim]Showing last {max_messages} of {message_buffer.timeline_count} messages[/dim]"
         )
 
     layout["messages"].update(
@@ -360,11 +528,13 @@ def update_display(layout, spinner_text=None):
         )
     )
 
+
+def _update_report_panel(layout):
     # Analysis panel showing current report
     if message_buffer.current_report:
         layout["analysis"].update(
             Panel(
-                Markdown(message_buffer.current_report),
+                message_buffer.current_report_md,
                 title="Current Report",
                 border_style="green",
                 padding=(1, 2),
@@ -380,14 +550,19 @@ def update_display(layout, spinner_text=None):
             )
         )
 
+
+def _update_footer_panel(layout):
+    global _footer_key
     # Footer with statistics
-    tool_calls_count = len(message_buffer.tool_calls)
-    llm_calls_count = sum(
-        1 for _, msg_type, _ in message_buffer.messages if msg_type == "Reasoning"
-    )
-    reports_count = sum(
-        1 for content in message_buffer.report_sections.values() if content is not None
-    )
+    tool_calls_count = message_buffer.tool_call_count
+    llm_calls_count = message_buffer.llm_call_count
+    reports_count = message_buffer.reports_count
+
+    # Messages that are not LLM calls flag the footer too; keep the panel if the numbers match
+    key = (tool_calls_count, llm_calls_count, reports_count)
+    if key == _footer_key:
+        return
+    _footer_key = key
 
     stats_table = Table(show_header=False, box=None, padding=(0, 2), expand=True)
     stats_table.add_column("Stats", justify="center")
@@ -408,20 +583,20 @@ def get_user_position():
     return typer.prompt("What is your current position on this ticker? (long, short, none)", default="none")
 
 
-def get_user_selections():
-    """Get all user selections before starting the analysis display."""
-    # Display ASCII art welcome message
-    with open("./cli/static/welcome.txt", "r", encoding="utf-8") as f:
+@lru_cache(maxsize=None)
+def _welcome_panel():
+    """Build the centered welcome box once; the ASCII art is read from disk on first use."""
+    with open(Path(__file__).parent / "static" / "welcome.txt", "r", encoding="utf-8") as f:
         welcome_ascii = f.read()
 
     # Create welcome box content
-    welcome_content = f"{welcome_ascii}\n"
-    welcome_content += "[bold green]TradingAgents: Multi-Agents LLM Financial Trading Framework - CLI[/bold green]\n\n"
-    welcome_content += "[bold]Workflow Steps:[/bold]\n"
-    welcome_content += "I. Analyst Team → II. Research Team → III. Trader → IV. Risk Management → V. Portfolio Management\n\n"
-    welcome_content += (
-        "[dim]Built by [Tauric Research](https://github.com/TauricResearch)[/dim]"
-    )
+    welcome_content = "\n".join([
+        welcome_ascii,
+        "[bold green]TradingAgents: Multi-Agents LLM Financial Trading Framework - CLI[/bold green]\n",
+        "[bold]Workflow Steps:[/bold]",
+        "I. Analyst Team → II. Research Team → III. Trader → IV. Risk Management → V. Portfolio Management\n",
+        "[dim]Built by [Tauric Research](https://github.com/TauricResearch)[/dim]",
+    ])
 
     # Create and center the welcome box
     welcome_box = Panel(
@@ -431,7 +606,13 @@ def get_user_selections():
         title="Welcome to TradingAgents",
         subtitle="Multi-Agents LLM Financial Trading Framework",
     )
-    console.print(Align.center(welcome_box))
+    return Align.center(welcome_box)
+
+
+def get_user_selections():
+    """Get all user selections before starting the analysis display."""
+    # Display ASCII art welcome message
+    console.print(_welcome_panel())
     console.print()  # Add a blank line after the welcome box
 
     # Create a boxed questionnaire for each step
@@ -534,14 +715,14 @@ def get_ticker():
 
 def get_analysis_date():
     """Get the analysis date from user input."""
+    today = datetime.date.today()
+    default_date = today.strftime("%Y-%m-%d")
     while True:
-        date_str = typer.prompt(
-            "", default=datetime.datetime.now().strftime("%Y-%m-%d")
-        )
+        date_str = typer.prompt("", default=default_date)
         try:
             # Validate date format and ensure it's not in the future
             analysis_date = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-            if analysis_date.date() > datetime.datetime.now().date():
+            if analysis_date.date() > today:
                 console.print("[red]Error: Analysis date cannot be in the future[/red]")
                 continue
             return date_str
@@ -553,7 +734,10 @@ def get_analysis_date():
 
 def display_complete_report(final_state):
     """Display the complete analysis report with team-based panels."""
-    console.print("\n[bold green]Complete Analysis Report[/bold green]\n")
+    # Collect everything and print once: inside the Live display every
+    # console.print also redraws the whole live layout.
+    renderables = []
+    renderables.append("\n[bold green]Complete Analysis Report[/bold green]\n")
 
     def _format_content_for_markdown(content):
         """Ensures content is a string."""
@@ -562,7 +746,7 @@ def display_complete_report(final_state):
     # User Position
     user_position = final_state.get("user_position", "none")
     cost_per_trade = final_state.get("cost_per_trade", 0.0)
-    console.print(Panel(f"User's current position: [bold]{user_position}[/bold]\nTrading cost per operation: [bold]{cost_per_trade}[/bold]", title="User Information", border_style="yellow", padding=(1, 2)))
+    renderables.append(Panel(f"User's current position: [bold]{user_position}[/bold]\nTrading cost per operation: [bold]{cost_per_trade}[/bold]", title="User Information", border_style="yellow", padding=(1, 2)))
 
     # I. Analyst Team Reports
     analyst_reports = []
@@ -612,7 +796,7 @@ def display_complete_report(final_state):
         )
 
     if analyst_reports:
-        console.print(
+        renderables.append(
             Panel(
                 Columns(analyst_reports, equal=True, expand=True),
                 title="I. Analyst Team Reports",
@@ -660,7 +844,7 @@ def display_complete_report(final_state):
             )
 
         if research_reports:
-            console.print(
+            renderables.append(
                 Panel(
                     Columns(research_reports, equal=True, expand=True),
                     title="II. Research Team Decision",
@@ -671,7 +855,7 @@ def display_complete_report(final_state):
 
     # III. Trading Team Reports
     if final_state.get("trader_investment_plan"):
-        console.print(
+        renderables.append(
             Panel(
                 Panel(
                     Markdown(_format_content_for_markdown(final_state["trader_investment_plan"])),
@@ -724,7 +908,7 @@ def display_complete_report(final_state):
             )
 
         if risk_reports:
-            console.print(
+            renderables.append(
                 Panel(
                     Columns(risk_reports, equal=True, expand=True),
                     title="IV. Risk Management Team Decision",
@@ -735,7 +919,7 @@ def display_complete_report(final_state):
 
         # V. Portfolio Manager Decision
         if risk_state.get("judge_decision"):
-            console.print(
+            renderables.append(
                 Panel(
                     Panel(
                         Markdown(_format_content_for_markdown(risk_state["judge_decision"])),
@@ -749,13 +933,29 @@ def display_complete_report(final_state):
                 )
             )
 
+    console.print(Group(*renderables))
+
+
+RESEARCH_TEAM = ("Bull Researcher", "Bear Researcher", "Research Manager", "Trader")
+_RESEARCH_TEAM_IDS = tuple(AGENT_IDS[agent] for agent in RESEARCH_TEAM)
+
 
 def update_research_team_status(status):
     """Update status for all research team members and trader."""
-    research_team = ["Bull Researcher", "Bear Researcher", "Research Manager", "Trader"]
-    for agent in research_team:
+    code = STATUS_IDS[status]
+    agent_status = message_buffer.agent_status
+    if all(agent_status[i] == code for i in _RESEARCH_TEAM_IDS):
+        return
+    for agent in RESEARCH_TEAM:
         message_buffer.update_agent_status(agent, status)
 
+# Renderers for Anthropic content block types; other block types are skipped
+_CONTENT_BLOCK_HANDLERS = {
+    'text': lambda item: item.get('text', ''),
+    'tool_use': lambda item: f"[Tool: {item.get('name', 'unknown')}]",
+}
+
+
 def extract_content_string(content):
     """Extract string content from various message formats."""
     if isinstance(content, str):
@@ -765,16 +965,229 @@ def extract_content_string(content):
         text_parts = []
         for item in content:
             if isinstance(item, dict):
-                if item.get('type') == 'text':
-                    text_parts.append(item.get('text', ''))
-                elif item.get('type') == 'tool_use':
-                    text_parts.append(f"[Tool: {item.get('name', 'unknown')}]")
+                handler = _CONTENT_BLOCK_HANDLERS.get(item.get('type'))
+                if handler:
+                    text_parts.append(handler(item))
             else:
                 text_parts.append(str(item))
         return ' '.join(text_parts)
     else:
         return str(content)
 
+def _debate_speaker(state, prefixes, judge_name):
+    """Guess who spoke last in a debate state from its current_response prefix."""
+    # Only the head is lowercased; responses can be KB-scale LLM output
+    head = (state.get("current_response") or "")[:16].lower()
+    for prefix, name in prefixes:
+        if head.startswith(prefix):
+            return name
+    if state.get("judge_decision"):
+        return judge_name
+    return None
+
+
+# current_response prefixes naming the speaker in each debate
+_INVEST_PREFIXES = (("bull", "Bull Researcher"), ("bear", "Bear Researcher"))
+_RISK_PREFIXES = (("risky", "Risky Analyst"), ("safe", "Safe Analyst"), ("neutral", "Neutral Analyst"))
+
+# Fallback message attribution as (state key, probe); the first truthy key decides
+_ATTRIBUTION_PROBES = (
+    ("market_report", lambda value: "Market Analyst"),
+    ("sentiment_report", lambda value: "Social Analyst"),
+    ("news_report", lambda value: "News Analyst"),
+    ("fundamentals_report", lambda value: "Fundamentals Analyst"),
+    (
+        "investment_debate_state",
+        lambda state: _debate_speaker(state, _INVEST_PREFIXES, "Research Manager"),
+    ),
+    (
+        "risk_debate_state",
+        lambda state: _debate_speaker(state, _RISK_PREFIXES, "Portfolio Manager"),
+    ),
+)
+
+
+def _first_attr(msg, names=("name", "role", "sender", "author")):
+    """First non-empty string attribute of msg among names.
+
+    Reads the instance __dict__ directly when there is one (LangChain messages
+    keep their fields there), avoiding a full attribute lookup per probe.
+    """
+    d = getattr(msg, "__dict__", None)
+    if d is not None:
+        for name in names:
+            value = d.get(name)
+            if isinstance(value, str) and value:
+                return value
+        return None
+    for name in names:
+        value = getattr(msg, name, None)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+@lru_cache(maxsize=64)
+def _agent_tag(agent_name):
+    """The "[Agent Name]" prefix used to tag streamed messages (built once per name)."""
+    return f"[{agent_name}]"
+
+
+def attribute_chunk(chunk):
+    """Best-effort agent name for a streamed chunk whose message carries none."""
+    for key, probe in _ATTRIBUTION_PROBES:
+        value = chunk.get(key)
+        if value:
+            return probe(value)
+    return None
+
+
+BULL_ANALYSIS_HEADER = "### Bull Researcher Analysis\n"
+BEAR_ANALYSIS_HEADER = "\n\n### Bear Researcher Analysis\n"
+RESEARCH_DECISION_HEADER = "\n\n### Research Manager Decision\n"
+
+
+def _handle_market_report(report, selections):
+    message_buffer.update_report_section("market_report", report)
+    message_buffer.update_agent_status("Market Analyst", "completed")
+    # Set next analyst to in_progress
+    if "social" in selections["analysts"]:
+        message_buffer.update_agent_status("Social Analyst", "in_progress")
+
+
+def _handle_sentiment_report(report, selections):
+    message_buffer.update_report_section("sentiment_report", report)
+    message_buffer.update_agent_status("Social Analyst", "completed")
+    # Set next analyst to in_progress
+    if "news" in selections["analysts"]:
+        message_buffer.update_agent_status("News Analyst", "in_progress")
+
+
+def _handle_news_report(report, selections):
+    message_buffer.update_report_section("news_report", report)
+    message_buffer.update_agent_status("News Analyst", "completed")
+    # Set next analyst to in_progress
+    if "fundamentals" in selections["analysts"]:
+        message_buffer.update_agent_status("Fundamentals Analyst", "in_progress")
+
+
+def _handle_fundamentals_report(report, selections):
+    message_buffer.update_report_section("fundamentals_report", report)
+    message_buffer.update_agent_status("Fundamentals Analyst", "completed")
+    # Set all research team members to in_progress
+    update_research_team_status("in_progress")
+
+
+def _last_line(text):
+    """Return the text after the last newline, scanning back from the end."""
+    return text[text.rfind("\n") + 1:]
+
+
+def _handle_investment_debate(debate_state, selections):
+    # The report is composed from parts here and joined once, so an unchanged
+    # chunk is a no-op. Bear/judge sections extend the bull section, or the
+    # current report when this chunk has no bull response.
+    parts = []
+
+    # Keep all research team members in progress until the final decision
+    if (
+        debate_state.get("bull_history")
+        or debate_state.get("bear_history")
+        or debate_state.get("judge_decision")
+    ):
+        update_research_team_status("in_progress")
+
+    # Update Bull Researcher status and report
+    if "bull_history" in debate_state and debate_state["bull_history"]:
+        # Extract latest bull response
+        latest_bull = _last_line(debate_state["bull_history"])
+        if latest_bull:
+            message_buffer.add_debate_message("Bull Researcher", latest_bull)
+            # Update research report with bull's latest analysis
+            parts = [BULL_ANALYSIS_HEADER, latest_bull]
+
+    # Update Bear Researcher status and report
+    if "bear_history" in debate_state and debate_state["bear_history"]:
+        # Extract latest bear response
+        latest_bear = _last_line(debate_state["bear_history"])
+        if latest_bear:
+            message_buffer.add_debate_message("Bear Researcher", latest_bear)
+            # Update research report with bear's latest analysis
+            parts = parts or [str(message_buffer.report_sections["investment_plan"])]
+            parts += (BEAR_ANALYSIS_HEADER, latest_bear)
+
+    # Update Research Manager status and final decision
+    if "judge_decision" in debate_state and debate_state["judge_decision"]:
+        message_buffer.add_debate_message(
+            "Research Manager",
+            f"Research Manager: {debate_state['judge_decision']}",
+        )
+        # Update research report with final decision
+        parts = parts or [str(message_buffer.report_sections["investment_plan"])]
+        parts += (RESEARCH_DECISION_HEADER, debate_state["judge_decision"])
+        # Mark all research team members as completed
+        update_research_team_status("completed")
+        # Set first risk analyst to in_progress
+        message_buffer.update_agent_status("Risky Analyst", "in_progress")
+
+    if parts:
+        message_buffer.update_report_section("investment_plan", "".join(parts))
+
+
+def _handle_trader_plan(plan, selections):
+    message_buffer.update_report_section("trader_investment_plan", plan)
+    # Set first risk analyst to in_progress
+    message_buffer.update_agent_status("Risky Analyst", "in_progress")
+
+
+# Risk debate speakers as (state key, agent name, report heading)
+RISK_SPEAKERS = (
+    ("current_risky_response", "Risky Analyst", "### Risky Analyst Analysis\n"),
+    ("current_safe_response", "Safe Analyst", "### Safe Analyst Analysis\n"),
+    ("current_neutral_response", "Neutral Analyst", "### Neutral Analyst Analysis\n"),
+)
+
+
+def _handle_risk_debate(risk_state, selections):
+    # Like the investment plan, the report is composed first and set once
+    report = message_buffer.report_sections["final_trade_decision"]
+    for key, agent, heading in RISK_SPEAKERS:
+        response = risk_state.get(key)
+        if response:
+            message_buffer.update_agent_status(agent, "in_progress")
+            message_buffer.add_debate_message(agent, f"{agent}: {response}")
+            # Update risk report with this analyst's latest analysis only
+            report = heading + response
+
+    # Update Portfolio Manager status and final decision
+    if "judge_decision" in risk_state and risk_state["judge_decision"]:
+        message_buffer.update_agent_status("Portfolio Manager", "in_progress")
+        message_buffer.add_debate_message(
+            "Portfolio Manager",
+            f"Portfolio Manager: {risk_state['judge_decision']}",
+        )
+        # Update risk report with final decision only
+        report = f"### Portfolio Manager Decision\n{risk_state['judge_decision']}"
+        # Mark risk analysts as completed
+        for agent in ("Risky Analyst", "Safe Analyst", "Neutral Analyst", "Portfolio Manager"):
+            message_buffer.update_agent_status(agent, "completed")
+
+    message_buffer.update_report_section("final_trade_decision", report)
+
+
+# Streamed state keys and their display/report handlers, in pipeline order.
+# Each handler is called as handler(value, selections) when the key is truthy.
+CHUNK_HANDLERS = {
+    "market_report": _handle_market_report,
+    "sentiment_report": _handle_sentiment_report,
+    "news_report": _handle_news_report,
+    "fundamentals_report": _handle_fundamentals_report,
+    "investment_debate_state": _handle_investment_debate,
+    "trader_investment_plan": _handle_trader_plan,
+    "risk_debate_state": _handle_risk_debate,
+}
+
+
 from tradingagents.utils.results import create_run_results_dirs
 
 
@@ -793,12 +1206,17 @@ def run_analysis():
     config["user_position"] = selections["user_position"]
     config["cost_per_trade"] = selections["cost_per_trade"]
     
-    print("\nConfiguration:")
-    for key, value in config.items():
-        print(f"  {key}: {value}")
-    print("")
+    print(
+        "\nConfiguration:\n"
+        + "\n".join(f"  {key}: {value}" for key, value in config.items())
+        + "\n"
+    )
         
     # Initialize the graph
+    # Imported here: the graph stack (LangChain, LLM clients, memory) takes
+    # seconds to import and is not needed for --help or the other commands
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
     graph = TradingAgentsGraph(
         [analyst.value for analyst in selections["analysts"]], config=config, debug=True
     )
@@ -815,49 +1233,52 @@ def run_analysis():
     def save_message_decorator(obj, func_name):
         func = getattr(obj, func_name)
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            func(*args, **kwargs)
-            timestamp, message_type, content = obj.messages[-1]
-            # Preserve newlines; add delimiter line for readability
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(f"{timestamp} [{message_type}]\n")
-                f.write(content.rstrip() + "\n---\n")
+        def wrapper(message_type, content):
+            func(message_type, content)
+            timestamp = obj.timeline[-1][0]
+            # Log the full content (the timeline only keeps truncated display text);
+            # preserve newlines and add a delimiter line for readability
+            obj.write_log(f"{timestamp} [{message_type}]\n{extract_content_string(content).rstrip()}\n---\n")
         return wrapper
     
     def save_tool_call_decorator(obj, func_name):
         func = getattr(obj, func_name)
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            func(*args, **kwargs)
-            timestamp, tool_name, args = obj.tool_calls[-1]
+        def wrapper(tool_name, args):
+            func(tool_name, args)
+            timestamp = obj.timeline[-1][0]
             args_str = ", ".join(f"{k}={v}" for k, v in args.items())
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(f"{timestamp} [TOOL_CALL] {tool_name}({args_str})\n")
-        return wrapper
-
-    def save_report_section_decorator(obj, func_name):
-        func = getattr(obj, func_name)
-        @wraps(func)
-        def wrapper(section_name, content):
-            func(section_name, content)
-            if section_name in obj.report_sections and obj.report_sections[section_name] is not None:
-                content = obj.report_sections[section_name]
-                if content:
-                    file_name = f"{section_name}.md"
-                    with open(report_dir / file_name, "w", encoding="utf-8") as f:
-                        f.write(str(content))
+            obj.write_log(f"{timestamp} [TOOL_CALL] {tool_name}({args_str})\n")
         return wrapper
 
     message_buffer.add_message = save_message_decorator(message_buffer, "add_message")
     message_buffer.add_tool_call = save_tool_call_decorator(message_buffer, "add_tool_call")
-    message_buffer.update_report_section = save_report_section_decorator(message_buffer, "update_report_section")
+    # Report sections are saved by update_display (flush_report_sections)
+    message_buffer.report_dir = report_dir
 
     # Now start the display layout
     layout = create_layout()
 
-    with Live(layout, refresh_per_second=1) as live:
+    # Piped/scripted runs get no live display, only the JSON summary printed at the end
+    if console.is_terminal:
+        live_display = Live(
+            layout,
+            refresh_per_second=_LIVE_REFRESH_PER_SECOND,
+            get_renderable=lambda: flush_pending_display(layout),
+        )
+    else:
+        live_display = nullcontext()
+    summary = None
+
+    # One buffered handle for the whole run instead of reopening the log per message;
+    # log lines are queued and update_display writes them out about once a second
+    with (
+        open(log_file, "ab", buffering=64 * 1024) as log_fh,
+        message_buffer.run_log(log_fh),
+        live_display,
+    ):
         # Initial display
-        update_display(layout)
+        update_display(layout, force=True)
 
         # Add initial messages
         message_buffer.add_message("System", f"Selected ticker: {selections['ticker']}")
@@ -868,28 +1289,24 @@ def run_analysis():
             "System",
             f"Selected analysts: {', '.join(analyst.value for analyst in selections['analysts'])}",
         )
-        update_display(layout)
+        update_display(layout, force=True)
 
         # Reset agent statuses
-        for agent in message_buffer.agent_status:
-            message_buffer.update_agent_status(agent, "pending")
+        message_buffer.set_all_statuses("pending")
 
         # Reset report sections
-        for section in message_buffer.report_sections:
-            message_buffer.report_sections[section] = None
-        message_buffer.current_report = None
-        message_buffer.final_report = None
+        message_buffer.reset_reports()
 
         # Update agent status to in_progress for the first analyst
         first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
         message_buffer.update_agent_status(first_analyst, "in_progress")
-        update_display(layout)
+        update_display(layout, force=True)
 
         # Create spinner text
         spinner_text = (
             f"Analyzing {selections['ticker']} on {selections['analysis_date']}..."
         )
-        update_display(layout, spinner_text)
+        update_display(layout, spinner_text, force=True)
 
         # Initialize state and get graph args
         init_agent_state = graph.propagator.create_initial_state(
@@ -897,8 +1314,8 @@ def run_analysis():
         )
         args = graph.propagator.get_graph_args()
 
-        # Stream the analysis
-        trace = []
+        # Stream the analysis; each chunk is the full state, so only the last is kept
+        last_chunk = None
         for chunk in graph.graph.stream(init_agent_state, **args):
             if len(chunk["messages"]) > 0:
                 # Get the last message from the chunk
@@ -906,53 +1323,23 @@ def run_analysis():
 
                 # Extract message content and type
                 if hasattr(last_message, "content"):
-                    content = extract_content_string(last_message.content)  # Use the helper function
+                    content = last_message.content
+                    if type(content) is not str:
+                        content = extract_content_string(content)  # Use the helper function
                     msg_type = "Reasoning"
                 else:
                     content = str(last_message)
                     msg_type = "System"
 
                 # Agent attribution (prefer explicit name, fallback to role)
-                agent_name = None
-                for attr in ("name", "role", "sender", "author"):
-                    if hasattr(last_message, attr):
-                        val = getattr(last_message, attr)
-                        if isinstance(val, str) and val:
-                            agent_name = val
-                            break
+                agent_name = _first_attr(last_message)
                 # Heuristic fallback attribution based on chunk keys if no intrinsic name
                 if not agent_name:
-                    if chunk.get("market_report"):
-                        agent_name = "Market Analyst"
-                    elif chunk.get("sentiment_report"):
-                        agent_name = "Social Analyst"
-                    elif chunk.get("news_report"):
-                        agent_name = "News Analyst"
-                    elif chunk.get("fundamentals_report"):
-                        agent_name = "Fundamentals Analyst"
-                    elif chunk.get("investment_debate_state"):
-                        # Decide bull/bear vs research manager by presence of history vs judge decision growth
-                        inv_state = chunk.get("investment_debate_state", {}) or {}
-                        # Prefer current_response origin if possible
-                        if inv_state.get("current_response", "").lower().startswith("bull"):
-                            agent_name = "Bull Researcher"
-                        elif inv_state.get("current_response", "").lower().startswith("bear"):
-                            agent_name = "Bear Researcher"
-                        elif inv_state.get("judge_decision"):
-                            agent_name = "Research Manager"
-                    elif chunk.get("risk_debate_state"):
-                        risk_state = chunk.get("risk_debate_state", {}) or {}
-                        # Very simple heuristic: look at last added history keyword
-                        if risk_state.get("current_response", "").lower().startswith("risky"):
-                            agent_name = "Risky Analyst"
-                        elif risk_state.get("current_response", "").lower().startswith("safe"):
-                            agent_name = "Safe Analyst"
-                        elif risk_state.get("current_response", "").lower().startswith("neutral"):
-                            agent_name = "Neutral Analyst"
-                        elif risk_state.get("judge_decision"):
-                            agent_name = "Portfolio Manager"
-                if agent_name and not content.startswith(f"[{agent_name}]"):
-                    content = f"[{agent_name}] {content}"
+                    agent_name = attribute_chunk(chunk)
+                if agent_name:
+                    tag = _agent_tag(agent_name)
+                    if not content.startswith(tag):
+                        content = f"{tag} {content}"
 
                 # Add message to buffer
                 message_buffer.add_message(msg_type, content)                
@@ -968,216 +1355,24 @@ def run_analysis():
                         else:
                             message_buffer.add_tool_call(tool_call.name, tool_call.args)
 
-                # Update reports and agent status based on chunk content
-                # Analyst Team Reports
-                if "market_report" in chunk and chunk["market_report"]:
-                    message_buffer.update_report_section(
-                        "market_report", chunk["market_report"]
-                    )
-                    message_buffer.update_agent_status("Market Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "social" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "Social Analyst", "in_progress"
-                        )
-
-                if "sentiment_report" in chunk and chunk["sentiment_report"]:
-                    message_buffer.update_report_section(
-                        "sentiment_report", chunk["sentiment_report"]
-                    )
-                    message_buffer.update_agent_status("Social Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "news" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "News Analyst", "in_progress"
-                        )
-
-                if "news_report" in chunk and chunk["news_report"]:
-                    message_buffer.update_report_section(
-                        "news_report", chunk["news_report"]
-                    )
-                    message_buffer.update_agent_status("News Analyst", "completed")
-                    # Set next analyst to in_progress
-                    if "fundamentals" in selections["analysts"]:
-                        message_buffer.update_agent_status(
-                            "Fundamentals Analyst", "in_progress"
-                        )
-
-                if "fundamentals_report" in chunk and chunk["fundamentals_report"]:
-                    message_buffer.update_report_section(
-                        "fundamentals_report", chunk["fundamentals_report"]
-                    )
-                    message_buffer.update_agent_status(
-                        "Fundamentals Analyst", "completed"
-                    )
-                    # Set all research team members to in_progress
-                    update_research_team_status("in_progress")
-
-                # Research Team - Handle Investment Debate State
-                if (
-                    "investment_debate_state" in chunk
-                    and chunk["investment_debate_state"]
-                ):
-                    debate_state = chunk["investment_debate_state"]
-
-                    # Update Bull Researcher status and report
-                    if "bull_history" in debate_state and debate_state["bull_history"]:
-                        # Keep all research team members in progress
-                        update_research_team_status("in_progress")
-                        # Extract latest bull response
-                        bull_responses = debate_state["bull_history"].split("\n")
-                        latest_bull = bull_responses[-1] if bull_responses else ""
-                        if latest_bull:
-                            message_buffer.add_message("Reasoning", latest_bull)
-                            # Update research report with bull's latest analysis
-                            message_buffer.update_report_section(
-                                "investment_plan",
-                                f"### Bull Researcher Analysis\n{latest_bull}",
-                            )
-
-                    # Update Bear Researcher status and report
-                    if "bear_history" in debate_state and debate_state["bear_history"]:
-                        # Keep all research team members in progress
-                        update_research_team_status("in_progress")
-                        # Extract latest bear response
-                        bear_responses = debate_state["bear_history"].split("\n")
-                        latest_bear = bear_responses[-1] if bear_responses else ""
-                        if latest_bear:
-                            message_buffer.add_message("Reasoning", latest_bear)
-                            # Update research report with bear's latest analysis
-                            message_buffer.update_report_section(
-                                "investment_plan",
-                                f"{message_buffer.report_sections['investment_plan']}\n\n### Bear Researcher Analysis\n{latest_bear}",
-                            )
-
-                    # Update Research Manager status and final decision
-                    if (
-                        "judge_decision" in debate_state
-                        and debate_state["judge_decision"]
-                    ):
-                        # Keep all research team members in progress until final decision
-                        update_research_team_status("in_progress")
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Research Manager: {debate_state['judge_decision']}",
-                        )
-                        # Update research report with final decision
-                        message_buffer.update_report_section(
-                            "investment_plan",
-                            f"{message_buffer.report_sections['investment_plan']}\n\n### Research Manager Decision\n{debate_state['judge_decision']}",
-                        )
-                        # Mark all research team members as completed
-                        update_research_team_status("completed")
-                        # Set first risk analyst to in_progress
-                        message_buffer.update_agent_status(
-                            "Risky Analyst", "in_progress"
-                        )
-
-                # Trading Team
-                if (
-                    "trader_investment_plan" in chunk
-                    and chunk["trader_investment_plan"]
-                ):
-                    message_buffer.update_report_section(
-                        "trader_investment_plan", chunk["trader_investment_plan"]
-                    )
-                    # Set first risk analyst to in_progress
-                    message_buffer.update_agent_status("Risky Analyst", "in_progress")
-
-                # Risk Management Team - Handle Risk Debate State
-                if "risk_debate_state" in chunk and chunk["risk_debate_state"]:
-                    risk_state = chunk["risk_debate_state"]
-
-                    # Update Risky Analyst status and report
-                    if (
-                        "current_risky_response" in risk_state
-                        and risk_state["current_risky_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Risky Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Risky Analyst: {risk_state['current_risky_response']}",
-                        )
-                        # Update risk report with risky analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Risky Analyst Analysis\n{risk_state['current_risky_response']}",
-                        )
-
-                    # Update Safe Analyst status and report
-                    if (
-                        "current_safe_response" in risk_state
-                        and risk_state["current_safe_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Safe Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Safe Analyst: {risk_state['current_safe_response']}",
-                        )
-                        # Update risk report with safe analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Safe Analyst Analysis\n{risk_state['current_safe_response']}",
-                        )
-
-                    # Update Neutral Analyst status and report
-                    if (
-                        "current_neutral_response" in risk_state
-                        and risk_state["current_neutral_response"]
-                    ):
-                        message_buffer.update_agent_status(
-                            "Neutral Analyst", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Neutral Analyst: {risk_state['current_neutral_response']}",
-                        )
-                        # Update risk report with neutral analyst's latest analysis only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Neutral Analyst Analysis\n{risk_state['current_neutral_response']}",
-                        )
-
-                    # Update Portfolio Manager status and final decision
-                    if "judge_decision" in risk_state and risk_state["judge_decision"]:
-                        message_buffer.update_agent_status(
-                            "Portfolio Manager", "in_progress"
-                        )
-                        message_buffer.add_message(
-                            "Reasoning",
-                            f"Portfolio Manager: {risk_state['judge_decision']}",
-                        )
-                        # Update risk report with final decision only
-                        message_buffer.update_report_section(
-                            "final_trade_decision",
-                            f"### Portfolio Manager Decision\n{risk_state['judge_decision']}",
-                        )
-                        # Mark risk analysts as completed
-                        message_buffer.update_agent_status("Risky Analyst", "completed")
-                        message_buffer.update_agent_status("Safe Analyst", "completed")
-                        message_buffer.update_agent_status(
-                            "Neutral Analyst", "completed"
-                        )
-                        message_buffer.update_agent_status(
-                            "Portfolio Manager", "completed"
-                        )
+                # Update reports and agent status based on chunk content,
+                # in pipeline order
+                for key, handler in CHUNK_HANDLERS.items():
+                    value = chunk.get(key)
+                    if value:
+                        handler(value, selections)
 
                 # Update the display
                 update_display(layout)
 
-            trace.append(chunk)
+            last_chunk = chunk
 
         # Get final state and decision
-        final_state = trace[-1]
+        final_state = last_chunk
         decision = graph.process_signal(final_state["final_trade_decision"])
 
         # Update all agent statuses to completed
-        for agent in message_buffer.agent_status:
-            message_buffer.update_agent_status(agent, "completed")
+        message_buffer.set_all_statuses("completed")
 
         message_buffer.add_message(
             "Analysis", f"Completed analysis for {selections['analysis_date']}"
@@ -1188,10 +1383,28 @@ def run_analysis():
             if section in final_state:
                 message_buffer.update_report_section(section, final_state[section])
 
-        # Display the complete final report
-        display_complete_report(final_state)
+        # Display the complete final report; piped/scripted runs get a compact
+        # JSON summary instead (the full sections are in the report files)
+        if console.is_terminal and not os.environ.get("TA_NO_FINAL_REPORT"):
+            display_complete_report(final_state)
+        else:
+            summary = {
+                "ticker": selections["ticker"],
+                "analysis_date": selections["analysis_date"],
+                "decision": decision,
+                "final_trade_decision": final_state.get("final_trade_decision"),
+                "reports": {
+                    section: os.path.join(report_dir, f"{section}.md")
+                    for section, content in message_buffer.report_sections.items()
+                    if content
+                },
+            }
+
+        update_display(layout, force=True)
 
-        update_display(layout)
+    # Printed after the live display has stopped so stdout holds only the JSON
+    if summary is not None:
+        print(json.dumps(summary, default=str))
 
 
 @app.command()
@@ -1206,6 +1419,30 @@ if __name__ == "__main__":
 # Multi-Ticker Parallel Mode Implementation #
 #############################################
 
+# Idle TradingAgentsGraph instances keyed by (analysts, config), reused across
+# analyze-multi tickers (per worker process). A graph is checked out for the
+# duration of one propagate() since it keeps per-run state (ticker, curr_state).
+_GRAPH_CACHE: dict[tuple, list] = {}
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+
+def _acquire_graph(analysts: list, config: dict):
+    """Return (cache_key, graph), reusing an idle graph built for the same analysts and config."""
+    key = (tuple(analysts), frozenset(config.items()))
+    with _GRAPH_CACHE_LOCK:
+        idle = _GRAPH_CACHE.get(key)
+        if idle:
+            return key, idle.pop()
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    return key, TradingAgentsGraph(analysts, config=config, debug=False)
+
+
+def _release_graph(key: tuple, graph):
+    with _GRAPH_CACHE_LOCK:
+        _GRAPH_CACHE.setdefault(key, []).append(graph)
+
+
 def _run_single_ticker(ticker: str, base_selections: dict, config_overrides: dict):
     """Non-interactive single ticker runner used by analyze-multi.
     Returns (ticker, success_bool, final_decision, results_dir, error_message).
@@ -1226,21 +1463,26 @@ def _run_single_ticker(ticker: str, base_selections: dict, config_overrides: dic
         config["user_position"] = selections["user_position"]
         config["cost_per_trade"] = selections["cost_per_trade"]
 
-        graph = TradingAgentsGraph([analyst.value for analyst in selections["analysts"]], config=config, debug=False)
+        graph_key, graph = _acquire_graph([analyst.value for analyst in selections["analysts"]], config)
 
         from tradingagents.utils.results import create_run_results_dirs
         results_dir, report_dir, log_file = create_run_results_dirs(config["results_dir"], selections["ticker"], selections["analysis_date"])
 
-        # Minimal callback to persist key reports
-        def on_step(state: dict):
-            report_keys = [
+        # Minimal callback to persist key reports (file paths built once per run)
+        report_dir_str = os.fspath(report_dir)
+        report_paths = {
+            rk: f"{report_dir_str}/{rk}.md"
+            for rk in (
                 "market_report", "sentiment_report", "news_report", "fundamentals_report",
                 "investment_plan", "trader_investment_plan", "final_trade_decision"
-            ]
-            for rk in report_keys:
+            )
+        }
+
+        def on_step(state: dict):
+            for rk, path in report_paths.items():
                 content = state.get(rk)
                 if content:
-                    with open(report_dir / f"{rk}.md", 'w', encoding='utf-8') as f:
+                    with open(path, 'w', encoding='utf-8') as f:
                         f.write(str(content))
 
         # Stream logger (messages only) for traceability
@@ -1250,25 +1492,45 @@ def _run_single_ticker(ticker: str, base_selections: dict, config_overrides: dic
                 last = msgs[-1]
                 text = getattr(last, 'content', None)
                 if isinstance(text, list):
-                    text = ' '.join(str(x) for x in text)
+                    text = ' '.join(map(str, text))
                 if text:
-                    with open(log_file, 'a', encoding='utf-8') as lf:
-                        lf.write(text.replace('\n',' ') + '\n')
-
-        final_state, processed_signal = graph.propagate(
-            selections['ticker'],
-            trade_date=selections['analysis_date'],
-            user_position=selections['user_position'],
-            cost_per_trade=config.get('cost_per_trade', 0.0),
-            on_step_callback=on_step,
-            on_stream_event=on_stream,
-        )
+                    log_fh.write((text.replace('\n', ' ') + '\n').encode('utf-8'))
+
+        # Keep the log open (buffered) for the whole run instead of reopening per event
+        with open(log_file, 'ab', buffering=64 * 1024) as log_fh:
+            final_state, processed_signal = graph.propagate(
+                selections['ticker'],
+                trade_date=selections['analysis_date'],
+                user_position=selections['user_position'],
+                cost_per_trade=config.get('cost_per_trade', 0.0),
+                on_step_callback=on_step,
+                on_stream_event=on_stream,
+            )
+        _release_graph(graph_key, graph)
         decision = processed_signal
         return ticker, True, decision, str(results_dir), None
     except Exception as e:
         return ticker, False, None, None, str(e)
 
 
+# Case-insensitive AnalystType lookup tables for analyze_multi
+_ANALYST_BY_LOWER = {at.value.lower(): at for at in AnalystType}
+_ANALYST_PREFIX = sorted(_ANALYST_BY_LOWER.items())
+
+
+def _lookup_analyst(token):
+    """Resolve an analyst token by exact or prefix match on the enum values (case-insensitive)."""
+    token = token.strip().lower()
+    if not token:
+        return None
+    at = _ANALYST_BY_LOWER.get(token)
+    if at is None:
+        i = bisect_left(_ANALYST_PREFIX, (token,))
+        if i < len(_ANALYST_PREFIX) and _ANALYST_PREFIX[i][0].startswith(token):
+            at = _ANALYST_PREFIX[i][1]
+    return at
+
+
 @app.command()
 def analyze_multi(
     tickers: str = typer.Option(..., help="Comma-separated tickers e.g. AAPL,MSFT,NVDA"),
@@ -1280,7 +1542,8 @@ def analyze_multi(
     analysis_date: str = typer.Option(datetime.date.today().isoformat(), help="Analysis date"),
     user_position: str = typer.Option("none", help="none|long|short"),
     cost_per_trade: float = typer.Option(0.0, help="Estimated cost per trade"),
-    analysts: str = typer.Option("market,social,news,fundamentals,bull,bear,research,trade,trader,risky,neutral,safe,portfolio_manager", help="Analyst identifiers list")
+    analysts: str = typer.Option("market,social,news,fundamentals,bull,bear,research,trade,trader,risky,neutral,safe,portfolio_manager", help="Analyst identifiers list"),
+    executor: str = typer.Option("process", help="process|thread (thread is useful for debugging)"),
 ):
     """Run multiple ticker analyses in parallel and produce a summary table.
 
@@ -1291,17 +1554,10 @@ def analyze_multi(
         console.print("[red]No tickers provided[/red]")
         raise typer.Exit(code=1)
 
-    # Map analyst string list to AnalystType enums where possible
-    chosen_analysts = []
-    for token in [a.strip() for a in analysts.split(',') if a.strip()]:
-        try:
-            chosen_analysts.append(AnalystType(token))
-        except ValueError:
-            # Attempt case-insensitive match on enum values
-            for at in AnalystType:
-                if at.value.lower().startswith(token.lower()):
-                    chosen_analysts.append(at)
-                    break
+    # Map analyst string list to AnalystType enums where possible (duplicates dropped)
+    chosen_analysts = list(dict.fromkeys(
+        at for at in map(_lookup_analyst, analysts.split(',')) if at is not None
+    ))
     if not chosen_analysts:
         console.print("[red]No valid analysts specified[/red]")
         raise typer.Exit(code=1)
@@ -1320,10 +1576,18 @@ def analyze_multi(
 
     start_time = time.time()
     results = []
-    max_workers = max(1, min(len(symbol_list), parallel))
+    max_workers = max(1, min(len(symbol_list), parallel, os.cpu_count() or 1))
     console.print(f"[bold cyan]Launching {len(symbol_list)} analyses (parallel={max_workers})...[/bold cyan]")
 
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        # One process per worker so the per-chunk Python work is not serialized on the GIL;
+        # fork (where available) avoids re-importing the graph stack in every worker
+        ctx = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn")
+        pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+
+    with pool as ex:
         future_map = {ex.submit(_run_single_ticker, sym, base_selections, {}): sym for sym in symbol_list}
         for fut in as_completed(future_map):
             sym = future_map[fut]
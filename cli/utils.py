@@ -1,5 +1,8 @@
 import os
+import re
 import questionary
+from datetime import datetime as _datetime
+from functools import lru_cache
 from typing import List
 from rich.console import Console
 from cli.models import AnalystType
@@ -7,6 +10,18 @@ from tradingagents.config_loader import get_providers, get_models
 
 console = Console()
 
+@lru_cache(maxsize=1)
+def _providers_cached() -> tuple:
+    """Configured providers, loaded once per CLI session."""
+    return tuple(get_providers())
+
+
+@lru_cache(maxsize=32)
+def _models_cached(provider: str, tier: str) -> tuple:
+    """Configured models for a provider tier, loaded once per CLI session."""
+    return tuple(get_models(provider, tier))
+
+
 ANALYST_ORDER = [
     ("Market Analyst", AnalystType.MARKET),
     ("Social Media Analyst", AnalystType.SOCIAL),
@@ -15,11 +30,16 @@ ANALYST_ORDER = [
 ]
 
 
+def _validate_ticker(text: str):
+    """questionary validator (runs per keystroke): True or an error message."""
+    return True if text.strip() else "Please enter a valid ticker symbol."
+
+
 def get_ticker() -> str:
     """Prompt the user to enter a ticker symbol."""
     ticker = questionary.text(
         "Enter the ticker symbol to analyze:",
-        validate=lambda x: len(x.strip()) > 0 or "Please enter a valid ticker symbol.",
+        validate=_validate_ticker,
         style=questionary.Style(
             [
                 ("text", "fg:green"),
@@ -35,24 +55,31 @@ def get_ticker() -> str:
     return ticker.strip().upper()
 
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+@lru_cache(maxsize=1)
+def _is_valid_date(date_str: str) -> bool:
+    """Whether date_str is a real YYYY-MM-DD date (the last input is memoized)."""
+    if not _DATE_RE.match(date_str):
+        return False
+    try:
+        _datetime.strptime(date_str, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+def _validate_date(text: str):
+    """questionary validator (runs per keystroke): True or an error message."""
+    return _is_valid_date(text.strip()) or "Please enter a valid date in YYYY-MM-DD format."
+
+
 def get_analysis_date() -> str:
     """Prompt the user to enter a date in YYYY-MM-DD format."""
-    import re
-    from datetime import datetime
-
-    def validate_date(date_str: str) -> bool:
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-            return False
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
-
     date = questionary.text(
         "Enter the analysis date (YYYY-MM-DD):",
-        validate=lambda x: validate_date(x.strip())
-        or "Please enter a valid date in YYYY-MM-DD format.",
+        validate=_validate_date,
         style=questionary.Style(
             [
                 ("text", "fg:green"),
@@ -127,10 +154,14 @@ def select_research_depth() -> int:
 
 
 def _select_model(provider: str, tier: str, prompt: str) -> str:
-    models = get_models(provider.lower(), tier)
+    models = _models_cached(provider.lower(), tier)
     if not models:
         console.print(f"[red]No models configured for provider '{provider}' tier '{tier}'.[/red]")
         exit(1)
+    if len(models) == 1:
+        # Nothing to choose between; skip the prompt
+        console.print(f"Using the only configured '{tier}' model: {models[0]['id']}")
+        return models[0]['id']
     choice = questionary.select(
         prompt,
         choices=[questionary.Choice(m.get('name', m['id']), value=m['id']) for m in models],
@@ -154,10 +185,15 @@ def select_deep_thinking_agent(provider) -> str:
     return _select_model(provider, "deep", "Select Your [Deep-Thinking LLM Engine]:")
 
 def select_llm_provider() -> tuple[str, str]:
-    providers = get_providers()
+    providers = _providers_cached()
     if not providers:
         console.print("[red]No providers configured. Exiting...[/red]")
         exit(1)
+    if len(providers) == 1:
+        # Nothing to choose between; skip the prompt
+        only = providers[0]
+        print(f"Using the only configured provider: {only['key']}\tURL: {only.get('base_url')}")
+        return only['key'], only.get('base_url')
     choice = questionary.select(
         "Select your LLM Provider:",
         choices=[questionary.Choice(p.get('display_name', p['key']), value=(p['key'], p.get('base_url'))) for p in providers],
@@ -1,8 +1,10 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+from functools import lru_cache
+from importlib.resources import files
 from rich.panel import Panel
-from rich.console import Console
+from rich.console import Console, Group
 from rich.align import Align
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
@@ -21,8 +23,13 @@ config["online_tools"] = True
 config["cost_per_trade"] = 0.0
 
 
-with open("./cli/static/welcome.txt", "r", encoding="utf-8") as f:
-    welcome_ascii = f.read()
+@lru_cache(maxsize=1)
+def _welcome_ascii():
+    """Banner art shipped with the cli package (independent of the working directory)."""
+    return files("cli").joinpath("static/welcome.txt").read_text(encoding="utf-8")
+
+
+welcome_ascii = _welcome_ascii()
 
 # Create welcome box content
 welcome_content = f"{welcome_ascii}\n"
@@ -42,8 +49,8 @@ welcome_box = Panel(
     subtitle="Multi-Agents LLM Financial Trading Framework",
 )
 console = Console()
-console.print(Align.center(welcome_box))
-console.print()  # Add a blank line after the welcome box
+# Welcome box plus a blank line after it, in one print
+console.print(Group(Align.center(welcome_box), ""))
     
 # Initialize with custom config
 ta = TradingAgentsGraph(debug=True, config=config)
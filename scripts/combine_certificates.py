@@ -8,6 +8,7 @@ the certifi certificate bundle to ensure all certificates are available.
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def combine_certificate_bundles():
@@ -39,20 +40,20 @@ def combine_certificate_bundles():
     
     # Create combined bundle
     try:
-        with open(combined_bundle, 'w') as combined_file:
+        # Bundles are copied as bytes in 1 MiB chunks rather than read into memory
+        with open(combined_bundle, 'wb') as combined_file:
             # Write corporate certificates first
             print("📝 Adding corporate certificates...")
-            with open(corporate_bundle, 'r') as corp_file:
-                combined_file.write(corp_file.read())
+            with open(corporate_bundle, 'rb') as corp_file:
+                shutil.copyfileobj(corp_file, combined_file, 1 << 20)
             
             # Add separator
-            combined_file.write("\n# Certifi certificates below\n")
+            combined_file.write(b"\n# Certifi certificates below\n")
             
             # Write certifi certificates
             print("📝 Adding certifi certificates...")
-            with open(certifi_bundle, 'r') as certifi_file:
-                certifi_content = certifi_file.read()
-                combined_file.write(certifi_content)
+            with open(certifi_bundle, 'rb') as certifi_file:
+                shutil.copyfileobj(certifi_file, combined_file, 1 << 20)
         
         print(f"✅ Combined certificate bundle created: {combined_bundle}")
         
@@ -89,15 +90,28 @@ def test_combined_bundle():
     test_urls = [
         "https://www.google.com",
         "https://api.openai.com/v1/models",
-        "https://openrouter.ai/api/v1/models"
+        "https://openrouter.ai/api/v1/models",
+        "https://finnhub.io"
     ]
     
-    for url in test_urls:
+    # One pooled session, URLs fetched in parallel; results printed in order
+    session = requests.Session()
+    session.verify = combined_bundle
+
+    def fetch(url):
         try:
-            response = requests.get(url, verify=combined_bundle, timeout=10)
-            print(f"✅ {url} - Status: {response.status_code}")
+            return session.get(url, timeout=10).status_code
         except Exception as e:
-            print(f"❌ {url} - Error: {e}")
+            return e
+
+    with session, ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+        results = list(executor.map(fetch, test_urls))
+
+    for url, result in zip(test_urls, results):
+        if isinstance(result, Exception):
+            print(f"❌ {url} - Error: {result}")
+        else:
+            print(f"✅ {url} - Status: {result}")
     
     return True
 
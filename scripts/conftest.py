@@ -0,0 +1,9 @@
+"""Shared setup for the scripts/ checks when they are collected by pytest."""
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Runs once, before any script module is imported (several read env vars at import time)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+load_dotenv()
@@ -1,25 +1,47 @@
 """Standalone diagnostic script to test a single LLM call with resilience.
 Run: python debug_llm_call.py --provider openai --model gpt-4o-mini --message "Test message".
 It will respect environment variables for keys and SSL the same way the graph does.
+
+By default the message is sent straight to the OpenAI-compatible client
+(OpenAI/OpenRouter/Ollama); pass --full-graph to build the TradingAgentsGraph
+and run the market analyst node instead.
 """
 import argparse
+import hashlib
 import os
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.graph.trading_graph import TradingAgentsGraph
-from langchain_core.messages import HumanMessage
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--provider', default=DEFAULT_CONFIG['llm_provider'])
-    parser.add_argument('--model', default=DEFAULT_CONFIG['quick_think_llm'])
-    parser.add_argument('--message', default='Say hello and include a short market summary placeholder.')
-    args = parser.parse_args()
+# Bump when the prompt layout sent by run_direct changes
+PROMPT_TEMPLATE_VERSION = '1'
 
-    cfg = DEFAULT_CONFIG.copy()
-    cfg['llm_provider'] = args.provider
-    cfg['quick_think_llm'] = args.model
-    cfg['deep_think_llm'] = args.model
+
+def prompt_cache_key(provider, model):
+    """Stable key for the shared prompt prefix, so repeated runs can hit a warm server-side cache.
+
+    Other direct chat.completions.create paths (e.g. quick_think calls) can pass a
+    key built the same way where the provider supports prompt_cache_key.
+    """
+    prefix = f"{provider}:{model}:{PROMPT_TEMPLATE_VERSION}"
+    return hashlib.blake2b(prefix.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def run_direct(cfg, args):
+    from tradingagents.utils.llm_client import build_openai_compatible_client
+
+    client, _ = build_openai_compatible_client(cfg, purpose="chat")
+    resp = client.chat.completions.create(
+        model=args.model,
+        messages=[{'role': 'user', 'content': args.message}],
+        extra_body={'prompt_cache_key': prompt_cache_key(args.provider, args.model)},
+    )
+    print('Model:', resp.model)
+    print('Reply snippet:', (resp.choices[0].message.content or '')[:500])
+
+
+def run_full_graph(cfg, args):
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+    from langchain_core.messages import HumanMessage
 
     graph = TradingAgentsGraph(config=cfg)
     # Build a minimal state for market analyst
@@ -38,5 +60,25 @@ def main():
     print('Market report snippet:', str(result_state.get('market_report',''))[:500])
 
 
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--provider', default=DEFAULT_CONFIG['llm_provider'])
+    parser.add_argument('--model', default=DEFAULT_CONFIG['quick_think_llm'])
+    parser.add_argument('--message', default='Say hello and include a short market summary placeholder.')
+    parser.add_argument('--full-graph', action='store_true',
+                        help='Build the full TradingAgentsGraph and run the market analyst node')
+    args = parser.parse_args()
+
+    cfg = DEFAULT_CONFIG.copy()
+    cfg['llm_provider'] = args.provider
+    cfg['quick_think_llm'] = args.model
+    cfg['deep_think_llm'] = args.model
+
+    if args.full_graph:
+        run_full_graph(cfg, args)
+    else:
+        run_direct(cfg, args)
+
+
 if __name__ == '__main__':
     main()
@@ -4,6 +4,7 @@ Debug script to test the TradingAgentsGraph streaming behavior
 """
 
 import os
+import reprlib
 from dotenv import load_dotenv
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
@@ -11,6 +12,13 @@ from tradingagents.default_config import DEFAULT_CONFIG
 # Load environment variables
 load_dotenv()
 
+# Bounded repr for state values: large strings/containers are cut short
+# without first rendering the whole object
+_REPR = reprlib.Repr()
+_REPR.maxstring = 100
+_REPR.maxother = 100
+_REPR.maxlist = 5
+
 def debug_callback(state):
     """Debug callback to see what state is being passed"""
     print(f"\n🔍 CALLBACK RECEIVED:")
@@ -21,7 +29,7 @@ def debug_callback(state):
         for key, value in state.items():
             if key in ["__end__", "messages"]:
                 continue
-            print(f"   {key}: {type(value)} - {str(value)[:100]}...")
+            print(f"   {key}: {type(value)} - {_REPR.repr(value)}...")
     print("-" * 50)
 
 def test_streaming():
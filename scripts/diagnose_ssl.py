@@ -10,7 +10,10 @@ import os
 import sys
 import ssl
 import socket
-import requests
+import asyncio
+import httpx
+from dataclasses import dataclass
+from typing import Optional
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 load_dotenv()
@@ -18,141 +21,267 @@ from tradingagents.dataflows.ssl_utils import get_certificate_info, get_ssl_conf
 from tradingagents.default_config import DEFAULT_CONFIG
 
 
-def test_ssl_connection(hostname, port=443):
-    """Test SSL connection to a specific hostname."""
-    print(f"\n🔒 Testing SSL connection to {hostname}:{port}")
-    
+# Built once: creating a default context parses the whole system trust store
+_SSL_CTX = ssl.create_default_context()
+
+
+# (hostname, port) -> every (family, sockaddr) getaddrinfo answer, in resolver order
+_RESOLVED = {}
+
+
+async def resolve(hostname, port):
+    """Resolve hostname:port once per run (non-blocking); repeated probes reuse the answers."""
+    key = (hostname, port)
+    if key not in _RESOLVED:
+        infos = await asyncio.get_running_loop().getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+        _RESOLVED[key] = [(family, sockaddr) for family, _, _, _, sockaddr in infos]
+    return _RESOLVED[key]
+
+
+async def probe_ssl_connection(hostname, port=443):
+    """Open a TLS connection to hostname:port and return the peer certificate."""
+    async def connect():
+        # Try each resolved address in order, so an unroutable IPv6 answer is not
+        # reported as an SSL failure; TLS errors are real findings and stop the probe
+        last_error = None
+        for family, sockaddr in await resolve(hostname, port):
+            try:
+                return await asyncio.open_connection(
+                    sockaddr[0], sockaddr[1], family=family, ssl=_SSL_CTX, server_hostname=hostname
+                )
+            except ssl.SSLError:
+                raise
+            except OSError as e:
+                last_error = e
+        raise last_error
+
+    _, writer = await asyncio.wait_for(connect(), timeout=10)
     try:
-        # Create SSL context
-        context = ssl.create_default_context()
-        
-        # Connect and get certificate info
-        with socket.create_connection((hostname, port), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                cert = ssock.getpeercert()
-                print(f"✅ SSL connection successful")
-                print(f"   Subject: {cert.get('subject', 'Unknown')}")
-                print(f"   Issuer: {cert.get('issuer', 'Unknown')}")
-                print(f"   Version: {cert.get('version', 'Unknown')}")
-                return True
-                
-    except Exception as e:
-        print(f"❌ SSL connection failed: {e}")
-        return False
+        return writer.get_extra_info("peercert")
+    finally:
+        writer.close()
 
 
-def test_requests_connection(url):
-    """Test HTTP request with requests library."""
-    print(f"\n🌐 Testing HTTP request to {url}")
-    
+def test_ssl_connection(hostname, port=443, result=None):
+    """Format an SSL connection probe (result of probe_ssl_connection, or the exception it raised).
+
+    Returns (ok, lines); the caller prints the lines.
+    """
+    lines = [f"\n🔒 Testing SSL connection to {hostname}:{port}"]
+
+    if isinstance(result, BaseException):
+        lines.append(f"❌ SSL connection failed: {result or type(result).__name__}")
+        return False, lines
+
+    cert = result or {}
+    lines += [
+        f"✅ SSL connection successful",
+        f"   Subject: {cert.get('subject', 'Unknown')}",
+        f"   Issuer: {cert.get('issuer', 'Unknown')}",
+        f"   Version: {cert.get('version', 'Unknown')}",
+    ]
+    return True, lines
+
+
+async def probe_requests_connection(client, url):
+    """GET url and return (status code, peer certificate subject)."""
+    async with client.stream("GET", url) as response:
+        stream = response.extensions.get("network_stream")
+        ssl_object = stream.get_extra_info("ssl_object") if stream else None
+        cert = ssl_object.getpeercert() if ssl_object else None
+        return response.status_code, (cert or {}).get("subject", "Unknown")
+
+
+def test_requests_connection(url, result=None):
+    """Format an HTTP request probe (result of probe_requests_connection, or the exception it raised).
+
+    Returns (ok, lines); the caller prints the lines.
+    """
+    lines = [f"\n🌐 Testing HTTP request to {url}"]
+
+    if isinstance(result, httpx.ConnectError) and "CERTIFICATE" in str(result).upper():
+        lines.append(f"❌ SSL Error: {result}")
+        return False, lines
+    if isinstance(result, BaseException):
+        lines.append(f"❌ Request failed: {result or type(result).__name__}")
+        return False, lines
+
+    status_code, cert_subject = result
+    lines += [
+        f"✅ HTTP request successful",
+        f"   Status: {status_code}",
+        f"   SSL Cert: {cert_subject}",
+    ]
+    return True, lines
+
+
+@dataclass(slots=True)
+class Probe:
+    """One diagnostic check: a TLS handshake with host:port, or an HTTP GET of url."""
+    host: str
+    port: int = 443
+    url: Optional[str] = None
+
+    @classmethod
+    def for_url(cls, url):
+        parsed = urlparse(url)
+        return cls(parsed.hostname, parsed.port or 443, url)
+
+    async def run(self, client, client_error=None):
+        """Run the check; returns (ok, lines) with any failure reported in the lines.
+
+        HTTP checks report client_error instead when the shared client could not be built.
+        """
+        try:
+            if self.url is None:
+                result = await probe_ssl_connection(self.host, self.port)
+            elif client is None:
+                result = client_error
+            else:
+                result = await probe_requests_connection(client, self.url)
+        except Exception as e:
+            result = e
+        if self.url is None:
+            return test_ssl_connection(self.host, self.port, result)
+        return test_requests_connection(self.url, result)
+
+
+async def run_probes(probes):
+    """Run all probes concurrently; results are (ok, lines) in probe order."""
+    # Same trust settings requests would use (REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE)
+    verify = os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE") or True
     try:
-        response = requests.get(url, timeout=10)
-        print(f"✅ HTTP request successful")
-        print(f"   Status: {response.status_code}")
-        print(f"   SSL Cert: {response.raw.connection.sock.getpeercert().get('subject', 'Unknown') if hasattr(response.raw.connection, 'sock') else 'Unknown'}")
-        return True
-        
-    except requests.exceptions.SSLError as e:
-        print(f"❌ SSL Error: {e}")
-        return False
+        client = httpx.AsyncClient(verify=verify, timeout=10)
     except Exception as e:
-        print(f"❌ Request failed: {e}")
-        return False
+        # A bad bundle path is one of the things being diagnosed: report it against
+        # every HTTP probe and still run the TLS probes, which do not use the client
+        if isinstance(e, OSError) and isinstance(verify, str):
+            e = OSError(f"Could not load the TLS CA certificate bundle {verify}: {e}")
+        return await asyncio.gather(*(probe.run(None, e) for probe in probes))
+    async with client:
+        return await asyncio.gather(*(probe.run(client) for probe in probes))
 
 
-def test_with_custom_cert_bundle(url, cert_bundle_path):
-    """Test HTTP request with custom certificate bundle."""
-    print(f"\n🔐 Testing with custom cert bundle: {cert_bundle_path}")
+async def probe_custom_cert_bundle(url, cert_bundle_path):
+    """GET url trusting only cert_bundle_path and return the status code."""
+    verify = ssl.create_default_context(cafile=cert_bundle_path)
+    async with httpx.AsyncClient(verify=verify, timeout=10) as client:
+        response = await client.get(url)
+        return response.status_code
+
+
+def test_with_custom_cert_bundle(url, cert_bundle_path, result=None):
+    """Format a custom cert bundle probe (result of probe_custom_cert_bundle, or the exception it raised).
+
+    Returns (ok, lines); the caller prints the lines.
+    """
+    lines = [f"\n🔐 Testing with custom cert bundle: {cert_bundle_path}"]
     
     if not os.path.exists(cert_bundle_path):
-        print(f"❌ Certificate bundle not found: {cert_bundle_path}")
-        return False
+        lines.append(f"❌ Certificate bundle not found: {cert_bundle_path}")
+        return False, lines
     
-    try:
-        response = requests.get(url, verify=cert_bundle_path, timeout=10)
-        print(f"✅ Request with custom cert bundle successful")
-        print(f"   Status: {response.status_code}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Request with custom cert bundle failed: {e}")
-        return False
+    if isinstance(result, BaseException):
+        lines.append(f"❌ Request with custom cert bundle failed: {result or type(result).__name__}")
+        return False, lines
+    
+    lines += [
+        f"✅ Request with custom cert bundle successful",
+        f"   Status: {result}",
+    ]
+    return True, lines
+
+
+async def run_checks(probes, cert_bundle_path=None):
+    """Run the probes and, if given, the custom cert bundle request, all concurrently."""
+    checks = [run_probes(probes)]
+    if cert_bundle_path and os.path.exists(cert_bundle_path):
+        checks.append(probe_custom_cert_bundle("https://www.google.com", cert_bundle_path))
+    results = await asyncio.gather(*checks, return_exceptions=True)
+    return results[0], (results[1] if len(results) > 1 else None)
 
 
 def main():
     """Main diagnostic function."""
-    print("🔍 TradingAgents SSL Certificate Diagnostic Tool")
-    print("=" * 50)
+    # Each section is collected into lines and written with a single print
+    lines = ["🔍 TradingAgents SSL Certificate Diagnostic Tool", "=" * 50]
     
     # Get certificate information
-    print("\n📋 Certificate Bundle Information:")
+    lines.append("\n📋 Certificate Bundle Information:")
     cert_info = get_certificate_info()
     for key, value in cert_info.items():
         if isinstance(value, list):
-            print(f"   {key}: {', '.join(value) if value else 'None found'}")
+            lines.append(f"   {key}: {', '.join(value) if value else 'None found'}")
         else:
-            print(f"   {key}: {value}")
+            lines.append(f"   {key}: {value}")
     
     # Test SSL configuration
-    print(f"\n⚙️ Current SSL Configuration:")
+    lines.append(f"\n⚙️ Current SSL Configuration:")
     ssl_config = get_ssl_config(DEFAULT_CONFIG)
     for key, value in ssl_config.items():
-        print(f"   {key}: {value}")
+        lines.append(f"   {key}: {value}")
+    print("\n".join(lines))
     
-    # Test common endpoints
-    test_endpoints = [
-        ("api.openai.com", 443),
-        ("openrouter.ai", 443),
-        ("generativelanguage.googleapis.com", 443),
-        ("www.google.com", 443)
+    # TLS endpoints and HTTP URLs are probed concurrently, then reported in order
+    probes = [
+        Probe("api.openai.com"),
+        Probe("openrouter.ai"),
+        Probe("generativelanguage.googleapis.com"),
+        Probe("www.google.com"),
+        Probe.for_url("https://api.openai.com/v1/models"),
+        Probe.for_url("https://www.google.com/search?q=test"),
+        Probe.for_url("https://openrouter.ai/api/v1/models"),
     ]
+    certifi_bundle = cert_info.get("certifi_bundle")
+    if certifi_bundle == "Not available (certifi not installed)":
+        certifi_bundle = None
+    results, bundle_result = asyncio.run(run_checks(probes, certifi_bundle))
+    if isinstance(results, BaseException):
+        # gather() returned the error instead of per-probe results; report it against every probe
+        results = [
+            test_ssl_connection(probe.host, probe.port, results) if probe.url is None
+            else test_requests_connection(probe.url, results)
+            for probe in probes
+        ]
     
-    print(f"\n🎯 Testing SSL connections:")
-    for hostname, port in test_endpoints:
-        test_ssl_connection(hostname, port)
-    
-    # Test HTTP requests
-    test_urls = [
-        "https://api.openai.com/v1/models",
-        "https://www.google.com/search?q=test",
-        "https://openrouter.ai/api/v1/models"
-    ]
+    lines = []
+    for heading, is_http in ((f"\n🎯 Testing SSL connections:", False), (f"\n🌍 Testing HTTP requests:", True)):
+        lines.append(heading)
+        for probe, (_, probe_lines) in zip(probes, results):
+            if (probe.url is not None) == is_http:
+                lines += probe_lines
+    print("\n".join(lines))
     
-    print(f"\n🌍 Testing HTTP requests:")
-    for url in test_urls:
-        test_requests_connection(url)
-    
-    # Test with different certificate bundles
-    if cert_info.get("certifi_bundle") and cert_info["certifi_bundle"] != "Not available (certifi not installed)":
+    # Test with different certificate bundles (already probed alongside the others)
+    if certifi_bundle:
         print(f"\n🧪 Testing with certifi bundle:")
-        test_with_custom_cert_bundle("https://www.google.com", cert_info["certifi_bundle"])
+        _, bundle_lines = test_with_custom_cert_bundle("https://www.google.com", certifi_bundle, bundle_result)
+        print("\n".join(bundle_lines))
     
     # Provide recommendations
-    print(f"\n💡 Recommendations:")
-    print("   📋 Certificate Bundle Configuration:")
-    print("      • Only set if you need a custom certificate bundle")
-    print("      • If not set, system default SSL behavior is used")
-    print("      export REQUESTS_CA_BUNDLE=/path/to/your/ca-bundle.crt")
-    print("      export CURL_CA_BUNDLE=/path/to/your/ca-bundle.crt")
-    
-    print("\n   ⚠️  SSL Verification (use with caution):")
-    print("      • Only disable for development/testing")
-    print("      • If not set, SSL verification is enabled by default")
-    print("      export SSL_VERIFY=false")
-    
-    print("\n   ⏱️  Timeout Configuration:")
-    print("      • Only set if default timeout is insufficient")
-    print("      export HTTP_TIMEOUT=60")
-    
-    print("\n   🌐 Proxy Configuration:")
-    print("      • Only required if behind corporate firewall")
-    print("      export HTTP_PROXY=http://proxy.company.com:8080")
-    print("      export HTTPS_PROXY=https://proxy.company.com:8080")
-    
-    print("\n   📝 Configuration:")
-    print("      • Add these to your .env file or export in shell")
-    print("      • Leave unset to use system defaults")
-    print("      • Only configure what you actually need")
+    print("\n".join([
+        f"\n💡 Recommendations:",
+        "   📋 Certificate Bundle Configuration:",
+        "      • Only set if you need a custom certificate bundle",
+        "      • If not set, system default SSL behavior is used",
+        "      export REQUESTS_CA_BUNDLE=/path/to/your/ca-bundle.crt",
+        "      export CURL_CA_BUNDLE=/path/to/your/ca-bundle.crt",
+        "\n   ⚠️  SSL Verification (use with caution):",
+        "      • Only disable for development/testing",
+        "      • If not set, SSL verification is enabled by default",
+        "      export SSL_VERIFY=false",
+        "\n   ⏱️  Timeout Configuration:",
+        "      • Only set if default timeout is insufficient",
+        "      export HTTP_TIMEOUT=60",
+        "\n   🌐 Proxy Configuration:",
+        "      • Only required if behind corporate firewall",
+        "      export HTTP_PROXY=http://proxy.company.com:8080",
+        "      export HTTPS_PROXY=https://proxy.company.com:8080",
+        "\n   📝 Configuration:",
+        "      • Add these to your .env file or export in shell",
+        "      • Leave unset to use system defaults",
+        "      • Only configure what you actually need",
+    ]))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,27 @@
-import requests
+import asyncio
+import httpx
 import json
 import os
+import sys
 from dotenv import load_dotenv
 load_dotenv()
 
-response = requests.get(
-  url="https://openrouter.ai/api/v1/key",
-  headers={
-    "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}"
-  }
-)
-print(json.dumps(response.json(), indent=2))
+try:
+  import orjson  # optional: faster parse/indent of the response
+except ImportError:
+  orjson = None
+
+
+async def main():
+  # One client for all status calls (connection reuse if more endpoints are added)
+  async with httpx.AsyncClient(
+    headers={"Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}"}
+  ) as client:
+    response = await client.get("https://openrouter.ai/api/v1/key")
+  if orjson is not None:
+    sys.stdout.buffer.write(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2) + b"\n")
+  else:
+    print(json.dumps(response.json(), indent=2))
+
+
+asyncio.run(main())
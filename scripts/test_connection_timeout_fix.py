@@ -10,6 +10,9 @@ This script tests that:
 
 import sys
 import os
+import ast
+from contextlib import contextmanager
+from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -19,6 +22,23 @@ from tradingagents.utils.llm_client import build_openai_compatible_client
 from tradingagents.default_config import DEFAULT_CONFIG
 
 
+@contextmanager
+def _dummy_key():
+    """Provide a dummy OPENAI_API_KEY for the block if none is set, restoring the env after.
+
+    Each test scopes its own env change, so tests do not depend on each other's
+    state and can run in any order or in separate workers (e.g. pytest -n auto).
+    """
+    if os.getenv("OPENAI_API_KEY"):
+        yield
+        return
+    os.environ["OPENAI_API_KEY"] = "test-key-for-verification"
+    try:
+        yield
+    finally:
+        os.environ.pop("OPENAI_API_KEY", None)
+
+
 def test_client_timeout_configuration():
     """Test that OpenAI client respects timeout configuration."""
     print("=" * 70)
@@ -30,19 +50,14 @@ def test_client_timeout_configuration():
     config['http_timeout'] = 120
     config['llm_max_retries'] = 5
     
-    # Set a dummy API key for testing if not present
-    import os
-    original_key = os.getenv("OPENAI_API_KEY")
-    if not original_key:
-        os.environ["OPENAI_API_KEY"] = "test-key-for-verification"
-    
     try:
-        client, _ = build_openai_compatible_client(
-            config,
-            purpose="chat",
-            timeout=config.get("http_timeout"),
-            max_retries=config.get("llm_max_retries")
-        )
+        with _dummy_key():
+            client, _ = build_openai_compatible_client(
+                config,
+                purpose="chat",
+                timeout=config.get("http_timeout"),
+                max_retries=config.get("llm_max_retries")
+            )
         
         print("✅ Client created successfully with timeout and max_retries")
         print(f"   Timeout: {config.get('http_timeout')} seconds")
@@ -58,10 +73,6 @@ def test_client_timeout_configuration():
     except Exception as e:
         print(f"❌ Failed to create client: {e}")
         return False
-    finally:
-        # Restore original state
-        if not original_key:
-            os.environ.pop("OPENAI_API_KEY", None)
 
 
 def test_client_without_timeout():
@@ -72,24 +83,15 @@ def test_client_without_timeout():
     
     config = DEFAULT_CONFIG.copy()
     
-    # Set a dummy API key for testing if not present
-    import os
-    original_key = os.getenv("OPENAI_API_KEY")
-    if not original_key:
-        os.environ["OPENAI_API_KEY"] = "test-key-for-verification"
-    
     try:
-        client, _ = build_openai_compatible_client(config, purpose="chat")
+        with _dummy_key():
+            client, _ = build_openai_compatible_client(config, purpose="chat")
         print("✅ Client created successfully without explicit timeout")
         print("   (Uses SDK defaults)")
         return True
     except Exception as e:
         print(f"❌ Failed to create client: {e}")
         return False
-    finally:
-        # Restore original state
-        if not original_key:
-            os.environ.pop("OPENAI_API_KEY", None)
 
 
 def test_retry_wrapper_logic():
@@ -122,7 +124,14 @@ def test_news_social_functions():
     print("=" * 70)
     
     from tradingagents.dataflows import interface
-    import inspect
+    
+    # Read and parse interface.py once; map top-level function name -> source
+    src = Path(interface.__file__).read_text(encoding="utf-8")
+    func_sources = {
+        node.name: ast.get_source_segment(src, node)
+        for node in ast.parse(src).body
+        if isinstance(node, ast.FunctionDef)
+    }
     
     functions_to_check = [
         'get_stock_news_from_llm',
@@ -132,11 +141,8 @@ def test_news_social_functions():
     
     all_good = True
     for func_name in functions_to_check:
-        if hasattr(interface, func_name):
-            func = getattr(interface, func_name)
-            source = inspect.getsource(func)
-            
-            if '_call_llm_api_with_retry' in source:
+        if func_name in func_sources:
+            if '_call_llm_api_with_retry' in func_sources[func_name]:
                 print(f"✅ {func_name} uses _call_llm_api_with_retry")
             else:
                 print(f"❌ {func_name} does NOT use _call_llm_api_with_retry")
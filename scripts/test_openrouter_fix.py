@@ -2,63 +2,65 @@
 """
 Test script to verify OpenRouter provider fixes in _call_llm_api
 """
-import sys
+import logging
 import os
 
-# Add the project root to the path
-sys.path.insert(0, os.path.dirname(__file__))
-
 from tradingagents.dataflows.interface import _get_valid_models
 
+logger = logging.getLogger(__name__)
+
+
 def test_get_valid_models():
     """Test that _get_valid_models returns correct models for each provider"""
     
-    print("Testing _get_valid_models function...\n")
+    logger.info("Testing _get_valid_models function...\n")
     
     # Test OpenAI
-    print("1. Testing OpenAI models:")
+    logger.info("1. Testing OpenAI models:")
     openai_models = _get_valid_models("openai")
-    print(f"   Found {len(openai_models)} models")
-    print(f"   Sample: {openai_models[:3]}")
+    logger.info(f"   Found {len(openai_models)} models")
+    logger.info(f"   Sample: {openai_models[:3]}")
     assert len(openai_models) > 0, "OpenAI should return models"
     assert "gpt-4o-mini" in openai_models, "Should include gpt-4o-mini"
-    print("   ✅ PASS\n")
+    logger.info("   ✅ PASS\n")
     
     # Test Gemini
-    print("2. Testing Gemini models:")
+    logger.info("2. Testing Gemini models:")
     gemini_models = _get_valid_models("gemini")
-    print(f"   Found {len(gemini_models)} models")
-    print(f"   Sample: {gemini_models[:3]}")
+    logger.info(f"   Found {len(gemini_models)} models")
+    logger.info(f"   Sample: {gemini_models[:3]}")
     assert len(gemini_models) > 0, "Gemini should return models"
     assert "gemini-1.5-flash" in gemini_models, "Should include gemini-1.5-flash"
-    print("   ✅ PASS\n")
+    logger.info("   ✅ PASS\n")
     
     # Test OpenRouter
-    print("3. Testing OpenRouter models:")
+    logger.info("3. Testing OpenRouter models:")
     openrouter_models = _get_valid_models("openrouter")
-    print(f"   Found {len(openrouter_models)} models")
+    logger.info(f"   Found {len(openrouter_models)} models")
     if len(openrouter_models) > 0:
-        print(f"   Sample: {openrouter_models[:5]}")
+        logger.info(f"   Sample: {openrouter_models[:5]}")
         # Check for some expected OpenRouter models
         has_llama = any("llama" in m.lower() for m in openrouter_models)
         has_deepseek = any("deepseek" in m.lower() for m in openrouter_models)
-        print(f"   Contains Llama models: {has_llama}")
-        print(f"   Contains DeepSeek models: {has_deepseek}")
+        logger.info(f"   Contains Llama models: {has_llama}")
+        logger.info(f"   Contains DeepSeek models: {has_deepseek}")
         assert has_llama or has_deepseek, "Should include Llama or DeepSeek models"
-        print("   ✅ PASS\n")
+        logger.info("   ✅ PASS\n")
     else:
-        print("   ⚠️  WARNING: No OpenRouter models found (YAML file issue?)\n")
+        logger.warning("   ⚠️  WARNING: No OpenRouter models found (YAML file issue?)\n")
     
     # Test unknown provider
-    print("4. Testing unknown provider:")
+    logger.info("4. Testing unknown provider:")
     unknown_models = _get_valid_models("unknown")
-    print(f"   Found {len(unknown_models)} models")
+    logger.info(f"   Found {len(unknown_models)} models")
     assert len(unknown_models) == 0, "Unknown provider should return empty list"
-    print("   ✅ PASS\n")
+    logger.info("   ✅ PASS\n")
     
-    print("=" * 60)
-    print("All tests passed! ✅")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("All tests passed! ✅")
+    logger.info("=" * 60)
 
 if __name__ == "__main__":
+    # Plain messages at INFO when run by hand; under pytest only warnings and errors are emitted
+    logging.basicConfig(level=os.getenv("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
     test_get_valid_models()
@@ -1,28 +1,45 @@
 #!/usr/bin/env python3
 """Test that SSL configuration works with and without custom certificates."""
 
+import logging
 import os
+import ssl
 import sys
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+import pytest
+
+if __name__ == "__main__":
+    # Under pytest, scripts/conftest.py has already loaded .env for the session
+    from dotenv import load_dotenv
+    load_dotenv()
+
+from tradingagents.utils.llm_client import _ssl_context, build_openai_compatible_client
+
+
+logger = logging.getLogger(__name__)
+
+
+def client_ssl_context(client):
+    """The SSLContext the OpenAI client's httpx transport was built with from the config."""
+    return client._client._transport._pool._ssl_context
 
-from tradingagents.utils.llm_client import build_openai_compatible_client
-from dotenv import load_dotenv
-load_dotenv()
 
-def test_ssl_scenarios():
-    """Test different SSL certificate scenarios."""
+def env_cert_bundle():
+    """CA bundle from the environment, which build_openai_compatible_client falls back to."""
+    return os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE")
+
+
+def run_ssl_scenarios():
+    """Try different SSL certificate scenarios; returns the list of failure messages."""
+    failures = []
     
-    print("=" * 80)
-    print("Testing SSL Configuration Compatibility")
-    print("=" * 80)
+    logger.info("=" * 80)
+    logger.info("Testing SSL Configuration Compatibility")
+    logger.info("=" * 80)
     
     # Scenario 1: With custom certificate bundle (Netskope)
-    print("\n📋 Scenario 1: WITH custom SSL certificate bundle")
-    print("-" * 80)
+    logger.info("\n📋 Scenario 1: WITH custom SSL certificate bundle")
+    logger.info("-" * 80)
     cert_path = "/Users/kevin.bruton/netskope-certificates/combined-cert-bundle.pem"
     if os.path.exists(cert_path):
         config_with_cert = {
@@ -33,23 +50,21 @@ def test_ssl_scenarios():
         }
         try:
             client, _ = build_openai_compatible_client(config_with_cert, timeout=30)
-            print(f"✅ Client created successfully with custom cert: {cert_path}")
-            print("   → This will use Netskope certificates")
-            print("   → Checking if httpx client has custom SSL context...")
-            # Check if client has custom http_client
-            if hasattr(client, '_client') and client._client is not None:
-                print("   ✅ Custom httpx client is configured")
-            else:
-                print("   ℹ️  Using default SSL settings")
+            logger.info(f"✅ Client created successfully with custom cert: {cert_path}")
+            logger.info("   → This will use Netskope certificates")
+            logger.info("   → Checking if httpx client has custom SSL context...")
+            assert client_ssl_context(client) is _ssl_context(cert_path), "custom cert bundle not applied"
+            logger.info("   ✅ Custom httpx client is configured")
         except Exception as e:
-            print(f"❌ Failed: {e}")
+            logger.error(f"❌ Failed: {e}")
+            failures.append(f"Scenario 1: {e}")
     else:
-        print(f"⚠️  Certificate not found at {cert_path}")
-        print("   (This is expected if not on Netskope network)")
+        logger.warning(f"⚠️  Certificate not found at {cert_path}")
+        logger.info("   (This is expected if not on Netskope network)")
     
     # Scenario 2: WITHOUT custom certificate bundle (normal environment)
-    print("\n📋 Scenario 2: WITHOUT custom SSL certificate bundle")
-    print("-" * 80)
+    logger.info("\n📋 Scenario 2: WITHOUT custom SSL certificate bundle")
+    logger.info("-" * 80)
     config_no_cert = {
         "llm_provider": "openrouter",
         "backend_url": "https://openrouter.ai/api/v1",
@@ -58,20 +73,18 @@ def test_ssl_scenarios():
     }
     try:
         client, _ = build_openai_compatible_client(config_no_cert, timeout=30)
-        print("✅ Client created successfully without custom cert")
-        print("   → This will use system default SSL certificates")
-        print("   → Works in normal environments (no Netskope)")
-        # Check if client uses default httpx behavior
-        if hasattr(client, '_client') and client._client is None:
-            print("   ✅ Using default httpx SSL (no custom client)")
-        elif not hasattr(client, '_client'):
-            print("   ✅ Using OpenAI SDK defaults")
+        logger.info("✅ Client created successfully without custom cert")
+        logger.info("   → This will use system default SSL certificates")
+        logger.info("   → Works in normal environments (no Netskope)")
+        assert client_ssl_context(client).verify_mode == ssl.CERT_REQUIRED, "certificate verification is off"
+        logger.info("   ✅ Certificates are verified")
     except Exception as e:
-        print(f"❌ Failed: {e}")
+        logger.error(f"❌ Failed: {e}")
+        failures.append(f"Scenario 2: {e}")
     
     # Scenario 3: With env var but file doesn't exist
-    print("\n📋 Scenario 3: Cert path in env but file doesn't exist")
-    print("-" * 80)
+    logger.info("\n📋 Scenario 3: Cert path in env but file doesn't exist")
+    logger.info("-" * 80)
     config_missing_cert = {
         "llm_provider": "openrouter",
         "backend_url": "https://openrouter.ai/api/v1",
@@ -80,14 +93,17 @@ def test_ssl_scenarios():
     }
     try:
         client, _ = build_openai_compatible_client(config_missing_cert, timeout=30)
-        print("✅ Client created successfully (ignored missing cert file)")
-        print("   → Falls back to system default SSL certificates")
+        logger.info("✅ Client created successfully (ignored missing cert file)")
+        # The missing file is skipped, not loaded (which would have raised), and verification stays on
+        assert client_ssl_context(client).verify_mode == ssl.CERT_REQUIRED, "certificate verification is off"
+        logger.info("   → Falls back to system default SSL certificates")
     except Exception as e:
-        print(f"❌ Failed: {e}")
+        logger.error(f"❌ Failed: {e}")
+        failures.append(f"Scenario 3: {e}")
     
     # Scenario 4: SSL verification disabled
-    print("\n📋 Scenario 4: SSL verification explicitly disabled")
-    print("-" * 80)
+    logger.info("\n📋 Scenario 4: SSL verification explicitly disabled")
+    logger.info("-" * 80)
     config_no_verify = {
         "llm_provider": "openrouter",
         "backend_url": "https://openrouter.ai/api/v1",
@@ -96,18 +112,44 @@ def test_ssl_scenarios():
     }
     try:
         client, _ = build_openai_compatible_client(config_no_verify, timeout=30)
-        print("✅ Client created with SSL verification disabled")
-        print("   ⚠️  Not recommended for production!")
+        if env_cert_bundle():
+            # A CA bundle from the environment takes precedence over ssl_verify=False
+            assert client_ssl_context(client) is _ssl_context(env_cert_bundle()), "environment cert bundle not applied"
+            logger.warning(f"⚠️  Verification stays on: CA bundle from the environment ({env_cert_bundle()}) is used")
+        else:
+            assert client_ssl_context(client).verify_mode == ssl.CERT_NONE, "certificate verification is still on"
+            logger.info("✅ Client created with SSL verification disabled")
+            logger.warning("   ⚠️  Not recommended for production!")
     except Exception as e:
-        print(f"❌ Failed: {e}")
+        logger.error(f"❌ Failed: {e}")
+        failures.append(f"Scenario 4: {e}")
     
-    print("\n" + "=" * 80)
-    print("✅ COMPATIBILITY TEST: SUCCESS")
-    print("The SSL configuration works in all scenarios:")
-    print("  • WITH Netskope proxy (custom certificates)")
-    print("  • WITHOUT Netskope proxy (system default)")
-    print("  • With missing certificate files (graceful fallback)")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    if failures:
+        logger.error("❌ COMPATIBILITY TEST: FAILED")
+        for failure in failures:
+            logger.info(f"  • {failure}")
+    else:
+        logger.info("✅ COMPATIBILITY TEST: SUCCESS")
+        logger.info("The SSL configuration works in all scenarios:")
+        logger.info("  • WITH Netskope proxy (custom certificates)")
+        logger.info("  • WITHOUT Netskope proxy (system default)")
+        logger.info("  • With missing certificate files (graceful fallback)")
+    logger.info("=" * 80)
+    return failures
+
+
+def test_ssl_scenarios(monkeypatch):
+    # Only client construction is exercised (no requests are sent), so a placeholder key is enough
+    if not os.getenv("OPENROUTER_API_KEY"):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    # Scenarios 2-4 are about running without a custom bundle
+    monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+    monkeypatch.delenv("CURL_CA_BUNDLE", raising=False)
+    assert run_ssl_scenarios() == []
+
 
 if __name__ == "__main__":
-    test_ssl_scenarios()
+    # Plain messages at INFO when run by hand; under pytest only warnings and errors are emitted
+    logging.basicConfig(level=os.getenv("TEST_LOG_LEVEL", "INFO"), format="%(message)s")
+    sys.exit(1 if run_ssl_scenarios() else 0)
@@ -30,6 +30,7 @@ setup(
     entry_points={
         "console_scripts": [
             "tradingagents=cli.main:app",
+            "tradingagents-web=webapp.launcher:run",
         ],
     },
     classifiers=[
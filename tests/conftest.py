@@ -0,0 +1,55 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from tradingagents.utils.run_manager import RunManager
+
+# webapp.main reads ENABLE_MULTI_RUN when it is imported. Setting it here, before
+# any test module is collected, lets every test file share a single import of
+# webapp.main instead of deleting it from sys.modules and re-importing it with
+# its own flags. The patch / content-patch / log-stream features are always on.
+os.environ['ENABLE_MULTI_RUN'] = '1'
+
+# Runs started through the web app write results/<TICKER>/<date>/... while the tests
+# poll for their status. Keep that tree (and pytest's own tmp_path tree) on tmpfs
+# where there is one, so it never lands in the checkout's results/ directory.
+_TMP_ROOT = Path('/dev/shm') if Path('/dev/shm').is_dir() else Path(tempfile.gettempdir())
+_USER = os.environ.get('USER', 'u')
+RESULTS_DIR = str(_TMP_ROOT / f'ta_results_{_USER}')
+os.environ['TRADINGAGENTS_RESULTS_DIR'] = RESULTS_DIR
+
+
+def pytest_configure(config):
+    # pytest empties an explicit basetemp at start-up, so it must not contain RESULTS_DIR
+    if not config.option.basetemp and _TMP_ROOT == Path('/dev/shm'):
+        config.option.basetemp = str(_TMP_ROOT / f'ta_tests_{_USER}')
+
+
+@pytest.fixture(autouse=True, scope='session')
+def results_dir_on_tmp():
+    """Point DEFAULT_CONFIG at RESULTS_DIR even if it was built before this conftest ran."""
+    from tradingagents.default_config import DEFAULT_CONFIG
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(DEFAULT_CONFIG, 'results_dir', RESULTS_DIR)
+        yield RESULTS_DIR
+
+
+@pytest.fixture
+def isolated_run_manager(monkeypatch):
+    """A fresh RunManager installed as the process-wide run_manager for one test.
+
+    Tests that register runs directly get an empty registry and leave nothing behind
+    in the shared singleton, so they neither need clean-up loops nor use up the
+    parallel-run slots of the multi-run tests, and they stay independent when the
+    suite is split across pytest-xdist workers.
+    """
+    import webapp.main as main
+    import tradingagents.utils.run_manager as run_manager_module
+
+    manager = RunManager(max_parallel=run_manager_module.run_manager.max_parallel)
+    monkeypatch.setattr(run_manager_module, 'run_manager', manager)
+    monkeypatch.setattr(main, 'run_manager', manager)
+    return manager
@@ -1,25 +1,14 @@
-import os, sys, importlib, time
+import time
 import pytest
 
-os.environ['ENABLE_MULTI_RUN'] = '1'
-os.environ['ENABLE_WS_PATCHES'] = '0'
-os.environ['ENABLE_CONTENT_PATCHES'] = '0'
+import webapp.main as main  # ENABLE_MULTI_RUN is set in conftest.py
 
-if 'webapp.main' in sys.modules:
-    del sys.modules['webapp.main']
-main = importlib.import_module('webapp.main')
-from tradingagents.utils.run_manager import run_manager
+@pytest.fixture
+def run_manager(isolated_run_manager):
+    return isolated_run_manager
 
-@pytest.fixture(autouse=True)
-def clear_runs():
-    for r in list(run_manager.list_runs(summary_only=False)):
-        run_manager._runs.pop(r['run_id'], None)  # type: ignore[attr-defined]
-    yield
-    for r in list(run_manager.list_runs(summary_only=False)):
-        run_manager._runs.pop(r['run_id'], None)  # type: ignore[attr-defined]
 
-
-def test_immediate_cancellation_before_progress():
+def test_immediate_cancellation_before_progress(run_manager):
     run_id = run_manager.create_run(ticker='MSFT', results_path='results/MSFT/test')
     # Immediately cancel before any execution tree updates (simulating race)
     canceled = run_manager.cancel_run(run_id)
@@ -31,7 +20,7 @@ def test_immediate_cancellation_before_progress():
     assert not run_manager.cancel_run(run_id)
 
 
-def test_cancellation_after_in_progress_transition():
+def test_cancellation_after_in_progress_transition(run_manager):
     run_id = run_manager.create_run(ticker='GOOG', results_path='results/GOOG/test')
     # Simulate worker marking in_progress quickly
     run_manager.update_run(run_id, status='in_progress')
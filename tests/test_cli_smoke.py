@@ -0,0 +1,16 @@
+import datetime
+
+from typer.testing import CliRunner
+
+import cli.main as cli_main
+
+
+def test_cli_main_keeps_datetime_module():
+    # cli.main star-imports cli.utils; a module-level name there must not shadow the datetime module
+    assert cli_main.datetime is datetime
+
+
+def test_cli_help_lists_commands():
+    result = CliRunner().invoke(cli_main.app, ['--help'])
+    assert result.exit_code == 0
+    assert 'analyze' in result.output
@@ -1,13 +1,6 @@
-import os, sys, importlib
 import pytest
 
-# Enable flags before import
-os.environ['ENABLE_WS_PATCHES'] = '1'
-os.environ['ENABLE_CONTENT_PATCHES'] = '1'
-
-if 'webapp.main' in sys.modules:
-    del sys.modules['webapp.main']
-main = importlib.import_module('webapp.main')
+import webapp.main as main
 _compute_content_patches = getattr(main, '_compute_content_patches')
 
 @pytest.fixture(autouse=True)
@@ -9,9 +9,15 @@ os.environ.setdefault("ENABLE_MULTI_RUN", "1")
 os.environ.setdefault("ENABLE_LOG_STREAM", "1")
 
 from webapp.main import app, log_run, ENABLE_LOG_STREAM  # type: ignore
-from tradingagents.utils.run_manager import run_manager
+import pytest
 
-def _create_dummy_run(ticker="TEST"):
+
+@pytest.fixture
+def run_manager(isolated_run_manager):
+    return isolated_run_manager
+
+
+def _create_dummy_run(run_manager, ticker="TEST"):
     run_id = run_manager.create_run(ticker, results_path="<pending>")
     run_manager.update_run(run_id, execution_tree=[], status="in_progress")
     return run_id
@@ -19,10 +25,10 @@ def _create_dummy_run(ticker="TEST"):
 client = TestClient(app)
 
 
-def test_logs_basic_filtering():
+def test_logs_basic_filtering(run_manager):
     if not ENABLE_LOG_STREAM:
         return  # skip if log streaming disabled
-    run_id = _create_dummy_run()
+    run_id = _create_dummy_run(run_manager)
     # Emit several severities
     log_run(run_id, "system init", severity="INFO", source="system")
     log_run(run_id, "debug detail", severity="DEBUG", source="system")
@@ -61,10 +67,10 @@ def test_logs_basic_filtering():
     assert msgs == ["warn condition"]
 
 
-def test_logs_pagination_after_seq():
+def test_logs_pagination_after_seq(run_manager):
     if not ENABLE_LOG_STREAM:
         return
-    run_id = _create_dummy_run("SEQ")
+    run_id = _create_dummy_run(run_manager, "SEQ")
     for i in range(5):
         log_run(run_id, f"line {i}", severity="INFO", source="system")
     time.sleep(0.02)
@@ -75,10 +81,10 @@ def test_logs_pagination_after_seq():
     assert all(e["seq"] > last_seq for e in nxt["entries"])  # strictly greater
 
 
-def test_logs_download_plain_text():
+def test_logs_download_plain_text(run_manager):
     if not ENABLE_LOG_STREAM:
         return
-    run_id = _create_dummy_run("DL")
+    run_id = _create_dummy_run(run_manager, "DL")
     log_run(run_id, "download test", severity="INFO", source="system")
     resp = client.get(f"/runs/{run_id}/logs/download")
     assert resp.status_code == 200
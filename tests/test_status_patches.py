@@ -1,16 +1,8 @@
-import os, sys, importlib
 import pytest
 
-# Ensure feature flag enabled BEFORE importing webapp.main
-os.environ['ENABLE_WS_PATCHES'] = '1'
-os.environ.setdefault('ENABLE_CONTENT_PATCHES', '0')  # Not needed for these tests
+import webapp.main as webapp_main
 
-# Force fresh import so conditional definitions are included
-if 'webapp.main' in sys.modules:
-    del sys.modules['webapp.main']
-webapp_main = importlib.import_module('webapp.main')
-
-# Convenience references (only present when ENABLE_WS_PATCHES=1 at import time)
+# Convenience references
 _compute_patch = getattr(webapp_main, '_compute_patch')
 _refresh_snapshot = getattr(webapp_main, '_refresh_snapshot')
 
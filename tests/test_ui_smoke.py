@@ -1,17 +1,7 @@
-import os, sys, importlib
 import re
 from fastapi.testclient import TestClient
 
-# Enable multi-run + patches + logs (simulate full feature set)
-os.environ['ENABLE_MULTI_RUN'] = '1'
-os.environ['ENABLE_WS_PATCHES'] = '1'
-os.environ['ENABLE_CONTENT_PATCHES'] = '1'
-os.environ['ENABLE_LOG_STREAM'] = '1'
-
-if 'webapp.main' in sys.modules:
-    del sys.modules['webapp.main']
-main = importlib.import_module('webapp.main')
-from tradingagents.utils.run_manager import run_manager
+import webapp.main as main  # full feature set: ENABLE_MULTI_RUN is set in conftest.py
 
 client = TestClient(main.app)
 
@@ -28,9 +18,9 @@ def test_index_page_loads_and_contains_expected_multi_run_elements():
     assert 'function websocketUrl(' in html
 
 
-def test_run_creation_and_internal_flags():
-    run_id = run_manager.create_run(ticker='TSLA', results_path='results/TSLA/test')
-    run = run_manager.get_run(run_id)
+def test_run_creation_and_internal_flags(isolated_run_manager):
+    run_id = isolated_run_manager.create_run(ticker='TSLA', results_path='results/TSLA/test')
+    run = isolated_run_manager.get_run(run_id)
     assert run is not None
     # Confirm feature flag globals reflect expected truthiness
     assert getattr(main, 'ENABLE_WS_PATCHES') is True
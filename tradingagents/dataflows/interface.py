@@ -7,14 +7,17 @@ from .finnhub_utils import get_data_in_range
 from .ssl_utils import get_ssl_config, setup_global_ssl_config
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from datetime import datetime
+import hashlib
 import json
 import os
+import shelve
+import threading
 import pandas as pd
 from tqdm import tqdm
 import yfinance as yf
-from openai import OpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
 from .config import get_config, set_config, DATA_DIR
 
 
@@ -730,34 +733,38 @@ def _get_valid_models(provider):
             "o1-mini"
         ]
     elif provider == "openrouter":
-        # Load OpenRouter models from providers_models.yaml
-        try:
-            import yaml
-            import os
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "providers_models.yaml"
-            )
-            with open(config_path, 'r') as f:
-                providers_config = yaml.safe_load(f)
-            
-            models = []
-            if 'providers' in providers_config and 'openrouter' in providers_config['providers']:
-                openrouter_models = providers_config['providers']['openrouter'].get('models', {})
-                # Collect all model IDs from both quick and deep categories
-                for category in ['quick', 'deep']:
-                    if category in openrouter_models:
-                        for model in openrouter_models[category]:
-                            if 'id' in model and model['id'] not in models:
-                                models.append(model['id'])
-            return models if models else []
-        except Exception:
-            # Fallback to empty list if YAML loading fails
-            return []
+        return list(_openrouter_model_ids())
     else:
         return []
 
 
+@lru_cache(maxsize=1)
+def _openrouter_model_ids():
+    """OpenRouter model IDs from providers_models.yaml, parsed once per process."""
+    try:
+        import yaml
+        config_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            "providers_models.yaml"
+        )
+        with open(config_path, 'r') as f:
+            providers_config = yaml.safe_load(f)
+        
+        models = []
+        if 'providers' in providers_config and 'openrouter' in providers_config['providers']:
+            openrouter_models = providers_config['providers']['openrouter'].get('models', {})
+            # Collect all model IDs from both quick and deep categories
+            for category in ['quick', 'deep']:
+                if category in openrouter_models:
+                    for model in openrouter_models[category]:
+                        if 'id' in model and model['id'] not in models:
+                            models.append(model['id'])
+        return tuple(models)
+    except Exception:
+        # Fallback to empty list if YAML loading fails
+        return ()
+
+
 def _call_llm_api_with_retry(prompt, config, max_attempts=None):
     """Wrapper around _call_llm_api with retry logic for transient errors.
     
@@ -823,6 +830,69 @@ def _call_llm_api_with_retry(prompt, config, max_attempts=None):
         raise last_error
     
 
+# Serializes access to the shelve file (tool calls may run on several threads)
+_LLM_CACHE_LOCK = threading.Lock()
+
+try:
+    import fcntl
+except ImportError:  # Windows: threads are still serialized, processes are not
+    fcntl = None
+
+
+@contextmanager
+def _llm_cache_locked(path):
+    """Hold _LLM_CACHE_LOCK and, where fcntl exists, an exclusive lock on path + ".lock".
+
+    The lock file serializes the shelve across processes (web app workers,
+    analyze-multi's process pool) as well as threads.
+    """
+    with _LLM_CACHE_LOCK:
+        if fcntl is None:
+            yield
+            return
+        with open(path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _llm_response_cache(call):
+    """Opt-in disk cache for _call_llm_api, enabled with config["llm_cache_mode"] = "read_through".
+
+    Responses are keyed on sha256(provider|model|prompt) and stored with shelve under
+    config["data_cache_dir"]. The live calls sample at temperature 1, so this is meant
+    for tests and development reruns, not for normal analysis runs.
+
+    Reads and writes hold a lock file next to the shelve, so several processes
+    (multi-worker web app, ``analyze-multi``) can share the cache dir. On Windows,
+    which has no fcntl, only threads are serialized: enable it for a single process there.
+    """
+    @wraps(call)
+    def wrapper(prompt, config):
+        if config.get("llm_cache_mode") != "read_through":
+            return call(prompt, config)
+
+        provider = config["llm_provider"]
+        model = config["gemini_quick_think_llm"] if provider == "gemini" else config["quick_think_llm"]
+        key = hashlib.sha256(f"{provider}|{model}|{prompt}".encode("utf-8")).hexdigest()
+        cache_dir = config.get("data_cache_dir") or os.path.join(os.path.dirname(__file__), "data_cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, "llm_responses")
+
+        with _llm_cache_locked(path), shelve.open(path) as cache:
+            if key in cache:
+                return cache[key]
+        response = call(prompt, config)
+        with _llm_cache_locked(path), shelve.open(path) as cache:
+            cache[key] = response
+        return response
+
+    return wrapper
+
+
+@_llm_response_cache
 def _call_llm_api(prompt, config):
     """Helper function to call either OpenAI or Gemini API based on configuration"""
     provider = config["llm_provider"]
@@ -833,6 +903,8 @@ def _call_llm_api(prompt, config):
         # Use Gemini
         import os
         from google.api_core.exceptions import NotFound, ResourceExhausted
+        # Deferred: langchain_google_genai is slow to import and only needed for Gemini
+        from langchain_google_genai import ChatGoogleGenerativeAI
         
         # Check if API key is available
         api_key = os.getenv("GOOGLE_API_KEY")
@@ -5,7 +5,8 @@ SSL/TLS configuration utilities for TradingAgents
 import os
 import ssl
 import certifi
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 
 def get_ssl_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -18,15 +19,30 @@ def get_ssl_config(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         SSL configuration dictionary with cert_bundle, verify, timeout, proxies
     """
+    # Memoized on the five settings it reads
+    ssl_config = dict(_ssl_config_for(
+        config.get("ssl_cert_bundle"),
+        config.get("ssl_verify", True),
+        config.get("http_timeout"),
+        config.get("http_proxy"),
+        config.get("https_proxy"),
+    ))
+    # Fresh copies so callers can modify the result without touching the cache
+    if "proxies" in ssl_config:
+        ssl_config["proxies"] = dict(ssl_config["proxies"])
+    return ssl_config
+
+
+@lru_cache(maxsize=32)
+def _ssl_config_for(cert_bundle, ssl_verify, http_timeout, http_proxy, https_proxy) -> Dict[str, Any]:
     ssl_config = {}
     
     # Certificate bundle configuration - only use if explicitly specified
-    cert_bundle = config.get("ssl_cert_bundle")
     if cert_bundle and cert_bundle.strip():
         # Use explicitly specified certificate bundle
         ssl_config["cert_bundle"] = cert_bundle
         ssl_config["verify"] = cert_bundle
-    elif not config.get("ssl_verify", True):
+    elif not ssl_verify:
         # Only disable SSL verification if explicitly set to false
         ssl_config["verify"] = False
     
@@ -34,15 +50,15 @@ def get_ssl_config(config: Dict[str, Any]) -> Dict[str, Any]:
     # don't set anything - use default behavior
     
     # Timeout configuration
-    if config.get("http_timeout"):
-        ssl_config["timeout"] = config["http_timeout"]
+    if http_timeout:
+        ssl_config["timeout"] = http_timeout
     
     # Proxy configuration
     proxies = {}
-    if config.get("http_proxy"):
-        proxies["http"] = config["http_proxy"]
-    if config.get("https_proxy"):
-        proxies["https"] = config["https_proxy"]
+    if http_proxy:
+        proxies["http"] = http_proxy
+    if https_proxy:
+        proxies["https"] = https_proxy
     if proxies:
         ssl_config["proxies"] = proxies
     
@@ -117,18 +133,25 @@ def get_certificate_info() -> Dict[str, str]:
     Returns:
         Dictionary with certificate bundle information
     """
-    info = {}
-    
+    certifi_bundle, system_cert_bundles = _installed_cert_bundles()
+    return {
+        "certifi_bundle": certifi_bundle,
+        # Environment variables are read on every call (setup_global_ssl_config may change them)
+        "env_ca_bundle": os.getenv("REQUESTS_CA_BUNDLE", "Not set"),
+        "env_curl_bundle": os.getenv("CURL_CA_BUNDLE", "Not set"),
+        "system_cert_bundles": list(system_cert_bundles),
+    }
+
+
+@lru_cache(maxsize=1)
+def _installed_cert_bundles() -> Tuple[str, Tuple[str, ...]]:
+    """certifi's bundle path and the system bundles present on disk, probed once per process."""
     # Check certifi bundle
     try:
         import certifi
-        info["certifi_bundle"] = certifi.where()
+        certifi_bundle = certifi.where()
     except ImportError:
-        info["certifi_bundle"] = "Not available (certifi not installed)"
-    
-    # Check environment variables
-    info["env_ca_bundle"] = os.getenv("REQUESTS_CA_BUNDLE", "Not set")
-    info["env_curl_bundle"] = os.getenv("CURL_CA_BUNDLE", "Not set")
+        certifi_bundle = "Not available (certifi not installed)"
     
     # Check system certificate stores
     common_cert_paths = [
@@ -144,6 +167,4 @@ def get_certificate_info() -> Dict[str, str]:
         if os.path.exists(path):
             available_system_certs.append(path)
     
-    info["system_cert_bundles"] = available_system_certs
-    
-    return info
\ No newline at end of file
+    return certifi_bundle, tuple(available_system_certs)
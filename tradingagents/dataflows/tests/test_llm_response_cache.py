@@ -0,0 +1,72 @@
+import multiprocessing
+import shelve
+
+import pytest
+
+from tradingagents.dataflows import interface
+
+
+def _counting_call():
+    calls = []
+
+    def call(prompt, config):
+        calls.append(prompt)
+        return f"response {len(calls)}"
+
+    return call, calls
+
+
+def test_llm_response_cache_read_through(tmp_path):
+    call, calls = _counting_call()
+    cached = interface._llm_response_cache(call)
+    config = {
+        "llm_provider": "openrouter",
+        "quick_think_llm": "some/model",
+        "data_cache_dir": str(tmp_path),
+        "llm_cache_mode": "read_through",
+    }
+    assert cached("prompt", config) == "response 1"
+    assert cached("prompt", config) == "response 1"
+    assert cached("other prompt", config) == "response 2"
+    assert cached("prompt", {**config, "quick_think_llm": "another/model"}) == "response 3"
+    assert calls == ["prompt", "other prompt", "prompt"]
+
+
+def test_llm_response_cache_disabled_by_default(tmp_path):
+    call, calls = _counting_call()
+    cached = interface._llm_response_cache(call)
+    config = {"llm_provider": "openai", "quick_think_llm": "gpt-4o-mini", "data_cache_dir": str(tmp_path)}
+    cached("prompt", config)
+    cached("prompt", config)
+    assert len(calls) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def _cache_from_process(prompts, cache_dir):
+    cached = interface._llm_response_cache(lambda prompt, config: f"answer to {prompt}")
+    config = {
+        "llm_provider": "openai",
+        "quick_think_llm": "gpt-4o-mini",
+        "data_cache_dir": cache_dir,
+        "llm_cache_mode": "read_through",
+    }
+    for prompt in prompts:
+        cached(prompt, config)
+
+
+def test_llm_response_cache_shared_by_processes(tmp_path):
+    if interface.fcntl is None or "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("cross-process locking needs fcntl")
+    ctx = multiprocessing.get_context("fork")
+    procs = [
+        ctx.Process(target=_cache_from_process, args=([f"p{n}-{i}" for i in range(20)], str(tmp_path)))
+        for n in range(3)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=60)
+    assert [proc.exitcode for proc in procs] == [0, 0, 0]
+    assert (tmp_path / "llm_responses.lock").exists()
+    with shelve.open(str(tmp_path / "llm_responses")) as cache:
+        assert len(cache) == 60
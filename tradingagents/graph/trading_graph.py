@@ -3,14 +3,9 @@
 import os
 from pathlib import Path
 import json
-import httpx
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
@@ -23,6 +18,7 @@ from tradingagents.agents.utils.agent_states import (
 )
 from tradingagents.dataflows.interface import set_config
 from tradingagents.dataflows.ssl_utils import setup_global_ssl_config
+from tradingagents.utils.llm_factory import create_llms
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
@@ -63,65 +59,7 @@ class TradingAgentsGraph:
         )
 
         # Initialize LLMs
-        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            # Handle API key based on provider
-            api_key = None
-            from tradingagents.utils.error_messages import missing_api_key
-            if self.config["llm_provider"].lower() == "openrouter":
-                api_key = os.getenv("OPENROUTER_API_KEY")
-                if not api_key:
-                    raise ValueError(missing_api_key("OpenRouter", "OPENROUTER_API_KEY", "Get your key from: https://openrouter.ai/keys"))
-            elif self.config["llm_provider"].lower() == "openai":
-                api_key = os.getenv("OPENAI_API_KEY")
-                if not api_key:
-                    raise ValueError(missing_api_key("OpenAI", "OPENAI_API_KEY"))
-            
-            # Prepare SSL configuration for HTTP client - only if explicitly configured
-            http_client_kwargs = {}
-            cert_bundle = self.config.get("ssl_cert_bundle")
-            
-            if cert_bundle and cert_bundle.strip():
-                http_client_kwargs["verify"] = cert_bundle
-            elif not self.config.get("ssl_verify", True):
-                http_client_kwargs["verify"] = False
-            
-            if self.config.get("http_timeout"):
-                http_client_kwargs["timeout"] = self.config["http_timeout"]
-            
-            # Add proxy configuration if specified
-            if self.config.get("http_proxy") or self.config.get("https_proxy"):
-                proxies = {}
-                if self.config.get("http_proxy"):
-                    proxies["http://"] = self.config["http_proxy"]
-                if self.config.get("https_proxy"):
-                    proxies["https://"] = self.config["https_proxy"]
-                http_client_kwargs["proxies"] = proxies
-            
-            # Create HTTP client only if we have custom settings
-            http_client = None
-            if http_client_kwargs:
-                http_client = httpx.Client(**http_client_kwargs)
-            
-            self.deep_thinking_llm = ChatOpenAI(
-                model=self.config["deep_think_llm"], 
-                base_url=self.config["backend_url"],
-                api_key=api_key,
-                http_client=http_client
-            )
-            self.quick_thinking_llm = ChatOpenAI(
-                model=self.config["quick_think_llm"], 
-                base_url=self.config["backend_url"],
-                api_key=api_key,
-                http_client=http_client
-            )
-        elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
+        self.deep_thinking_llm, self.quick_thinking_llm = create_llms(self.config)
         
         self.toolkit = Toolkit(config=self.config)
 
@@ -235,9 +173,10 @@ class TradingAgentsGraph:
 
         if on_step_callback or on_stream_event or self.debug:
             # Stream mode for callbacks or debug mode
-            trace = []
+            # Chunks are full states; keep only the latest rather than the whole trace
+            final_state = {}
             for s in self.graph.stream(init_agent_state, **args):
-                trace.append(s)
+                final_state = s
                 if on_stream_event:
                     try:
                         on_stream_event(s)
@@ -248,7 +187,6 @@ class TradingAgentsGraph:
                         on_step_callback(s)
                     except Exception:
                         pass
-            final_state = trace[-1] if trace else {}
         else:
             # Standard mode without tracing
             final_state = self.graph.invoke(init_agent_state, **args)
@@ -15,9 +15,12 @@ The embedding model name is provided for contexts (like memory) that need
 an embedding model hint tied to provider differences.
 """
 from __future__ import annotations
+import atexit
 import os
 import ssl
-from typing import Tuple, Optional
+import threading
+from functools import lru_cache
+from typing import Dict, Tuple, Optional
 
 try:
     from openai import OpenAI  # type: ignore
@@ -55,17 +58,36 @@ def _get_api_key(provider: str) -> Optional[str]:
     return None
 
 
+# Clients built by build_openai_compatible_client, keyed on
+# (backend_url, api_key, cert_bundle, ssl_verify, timeout, max_retries)
+_CLIENT_CACHE: Dict[tuple, OpenAI] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _ssl_context(cert_bundle: str) -> ssl.SSLContext:
+    """SSLContext for a CA bundle, built once per path (loading the PEM file is the slow part)."""
+    return ssl.create_default_context(cafile=cert_bundle)
+
+
 def build_openai_compatible_client(
     config: dict, 
     purpose: str = "chat",
     timeout: Optional[int] = None,
-    max_retries: Optional[int] = None
+    max_retries: Optional[int] = None,
+    http_client: Optional[httpx.Client] = None,
 ) -> Tuple[OpenAI, Optional[str]]:
     """Build and return an OpenAI-compatible client + optional model hint.
 
     purpose: one of {"chat", "embeddings"} to select default model hint.
     timeout: optional timeout in seconds for API calls.
     max_retries: optional number of retries for failed API calls.
+    http_client: optional pre-built (pooled) httpx.Client to use as-is; when given,
+        the SSL/timeout settings from config are not applied, so callers can share
+        one keep-alive connection pool across many clients.
+
+    Without http_client, clients are cached per backend, key, SSL settings,
+    timeout and max_retries, and the same client is returned for every purpose.
     """
     provider = _detect_provider(config)
     backend_url = config.get("backend_url") or (
@@ -84,25 +106,42 @@ def build_openai_compatible_client(
             "export OPENAI_API_KEY=your_key_here"
         )
 
-    # Configure SSL/TLS for httpx (used by OpenAI SDK)
-    httpx_kwargs = {}
-    
-    # Check for custom certificate bundle
-    cert_bundle = config.get("ssl_cert_bundle") or os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE")
-    if cert_bundle and os.path.exists(cert_bundle):
-        # Create SSL context with custom certificate bundle
-        ssl_context = ssl.create_default_context(cafile=cert_bundle)
-        httpx_kwargs["verify"] = ssl_context
-    elif not config.get("ssl_verify", True):
-        # Disable SSL verification if explicitly set to false
-        httpx_kwargs["verify"] = False
-    
-    # Add timeout if specified
-    if timeout is not None:
-        httpx_kwargs["timeout"] = timeout
-    
-    # Create httpx client with SSL configuration
-    http_client = httpx.Client(**httpx_kwargs) if httpx_kwargs else None
+    embedding_model = None
+    if purpose == "embeddings":
+        embedding_model = DEFAULT_EMBEDDING_MODEL.get(provider)
+
+    # Configure SSL/TLS for httpx (used by OpenAI SDK), unless the caller
+    # supplied its own (already configured) client
+    cache_key = None
+    if http_client is None:
+        # Check for custom certificate bundle
+        cert_bundle = config.get("ssl_cert_bundle") or os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE")
+        if not (cert_bundle and os.path.isfile(cert_bundle)):
+            cert_bundle = None
+        ssl_verify = bool(config.get("ssl_verify", True))
+
+        # Reuse a client already built with the same settings; purpose is not part
+        # of the key, so chat and embeddings calls share one connection pool
+        cache_key = (backend_url, api_key, cert_bundle, ssl_verify, timeout, max_retries)
+        with _CLIENT_CACHE_LOCK:
+            cached = _CLIENT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached, embedding_model
+
+        httpx_kwargs = {}
+        if cert_bundle:
+            # SSL context with custom certificate bundle, shared by clients using the same file
+            httpx_kwargs["verify"] = _ssl_context(cert_bundle)
+        elif not ssl_verify:
+            # Disable SSL verification if explicitly set to false
+            httpx_kwargs["verify"] = False
+        
+        # Add timeout if specified
+        if timeout is not None:
+            httpx_kwargs["timeout"] = timeout
+        
+        # Create httpx client with SSL configuration
+        http_client = httpx.Client(**httpx_kwargs) if httpx_kwargs else None
 
     # Build OpenAI client kwargs
     client_kwargs = {
@@ -119,11 +158,27 @@ def build_openai_compatible_client(
         client_kwargs["max_retries"] = max_retries
     
     client = OpenAI(**client_kwargs)
-
-    embedding_model = None
-    if purpose == "embeddings":
-        embedding_model = DEFAULT_EMBEDDING_MODEL.get(provider)
+    if cache_key is not None:
+        with _CLIENT_CACHE_LOCK:
+            cached = _CLIENT_CACHE.setdefault(cache_key, client)
+        if cached is not client:
+            # Another thread cached a client for these settings first; release our pool
+            client.close()
+            client = cached
 
     return client, embedding_model
 
+
+@atexit.register
+def _close_cached_clients() -> None:
+    """Close the pooled connections of every cached client at interpreter exit."""
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
 __all__ = ["build_openai_compatible_client"]
@@ -0,0 +1,86 @@
+"""Chat model factory shared by the trading graph and any caller that only needs the LLMs.
+
+Kept free of graph and agent imports; each provider's LangChain package is
+imported only when that provider is selected.
+"""
+import os
+from typing import Any, Dict, Tuple
+
+import httpx
+
+
+def create_llms(config: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Build the (deep_thinking_llm, quick_thinking_llm) pair for config["llm_provider"].
+
+    Only the chat models (with their SSL/proxy/timeout settings) are created, so
+    callers that just need the LLMs do not pay for memories, tool nodes and the graph.
+    """
+    if config["llm_provider"].lower() == "openai" or config["llm_provider"] == "ollama" or config["llm_provider"] == "openrouter":
+        # Handle API key based on provider
+        api_key = None
+        from tradingagents.utils.error_messages import missing_api_key
+        if config["llm_provider"].lower() == "openrouter":
+            api_key = os.getenv("OPENROUTER_API_KEY")
+            if not api_key:
+                raise ValueError(missing_api_key("OpenRouter", "OPENROUTER_API_KEY", "Get your key from: https://openrouter.ai/keys"))
+        elif config["llm_provider"].lower() == "openai":
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError(missing_api_key("OpenAI", "OPENAI_API_KEY"))
+        
+        # Prepare SSL configuration for HTTP client - only if explicitly configured
+        http_client_kwargs = {}
+        cert_bundle = config.get("ssl_cert_bundle")
+        
+        if cert_bundle and cert_bundle.strip():
+            http_client_kwargs["verify"] = cert_bundle
+        elif not config.get("ssl_verify", True):
+            http_client_kwargs["verify"] = False
+        
+        if config.get("http_timeout"):
+            http_client_kwargs["timeout"] = config["http_timeout"]
+        
+        # Add proxy configuration if specified
+        if config.get("http_proxy") or config.get("https_proxy"):
+            proxies = {}
+            if config.get("http_proxy"):
+                proxies["http://"] = config["http_proxy"]
+            if config.get("https_proxy"):
+                proxies["https://"] = config["https_proxy"]
+            http_client_kwargs["proxies"] = proxies
+        
+        # Create HTTP client only if we have custom settings
+        http_client = None
+        if http_client_kwargs:
+            http_client = httpx.Client(**http_client_kwargs)
+        
+        from langchain_openai import ChatOpenAI
+
+        deep_thinking_llm = ChatOpenAI(
+            model=config["deep_think_llm"], 
+            base_url=config["backend_url"],
+            api_key=api_key,
+            http_client=http_client
+        )
+        quick_thinking_llm = ChatOpenAI(
+            model=config["quick_think_llm"], 
+            base_url=config["backend_url"],
+            api_key=api_key,
+            http_client=http_client
+        )
+    elif config["llm_provider"].lower() == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        deep_thinking_llm = ChatAnthropic(model=config["deep_think_llm"], base_url=config["backend_url"])
+        quick_thinking_llm = ChatAnthropic(model=config["quick_think_llm"], base_url=config["backend_url"])
+    elif config["llm_provider"].lower() == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        deep_thinking_llm = ChatGoogleGenerativeAI(model=config["deep_think_llm"])
+        quick_thinking_llm = ChatGoogleGenerativeAI(model=config["quick_think_llm"])
+    else:
+        raise ValueError(f"Unsupported LLM provider: {config['llm_provider']}")
+    return deep_thinking_llm, quick_thinking_llm
+
+
+__all__ = ["create_llms"]
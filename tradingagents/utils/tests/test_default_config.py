@@ -0,0 +1,20 @@
+import pytest
+from tradingagents.default_config import build_default_config
+
+
+@pytest.mark.parametrize("env,expected", [
+    ({}, {"ssl_cert_bundle": None, "ssl_verify": True, "http_timeout": None}),
+    ({"REQUESTS_CA_BUNDLE": "/etc/ssl/cert.pem"}, {"ssl_cert_bundle": "/etc/ssl/cert.pem", "ssl_verify": True}),
+    ({"CURL_CA_BUNDLE": "/tmp/curl.pem"}, {"ssl_cert_bundle": "/tmp/curl.pem"}),
+    ({"SSL_VERIFY": "false"}, {"ssl_verify": False}),
+    ({"HTTP_TIMEOUT": "60", "HTTPS_PROXY": "https://proxy:8443"}, {"http_timeout": 60, "https_proxy": "https://proxy:8443"}),
+])
+def test_build_default_config_ssl_env(env, expected):
+    cfg = build_default_config(env)
+    for key, value in expected.items():
+        assert cfg[key] == value
+
+
+def test_build_default_config_requests_bundle_wins():
+    cfg = build_default_config({"REQUESTS_CA_BUNDLE": "/a.pem", "CURL_CA_BUNDLE": "/b.pem"})
+    assert cfg["ssl_cert_bundle"] == "/a.pem"
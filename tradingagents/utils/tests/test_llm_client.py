@@ -9,6 +9,7 @@ class DummyOpenAI:
 @pytest.fixture(autouse=True)
 def patch_openai(monkeypatch):
     monkeypatch.setattr(lc, 'OpenAI', DummyOpenAI)
+    monkeypatch.setattr(lc, '_CLIENT_CACHE', {})
 
 def test_detect_provider_from_backend_url_openrouter():
     config = {"backend_url": "https://openrouter.ai/api/v1"}
@@ -42,3 +43,85 @@ def test_build_openai_client_openai_success(monkeypatch):
     client, embedding = lc.build_openai_compatible_client({"llm_provider": "openai"}, purpose='embeddings')
     assert client.api_key == 'sk-test'
     assert embedding == 'text-embedding-3-small'
+
+def test_build_openai_client_reuses_supplied_http_client(monkeypatch):
+    class KwargsOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(lc, 'OpenAI', KwargsOpenAI)
+    monkeypatch.setenv('OPENROUTER_API_KEY', 'or-key')
+    pool = lc.httpx.Client()
+    try:
+        first, _ = lc.build_openai_compatible_client(
+            {"llm_provider": "openrouter", "ssl_verify": False}, timeout=5, http_client=pool
+        )
+        second, _ = lc.build_openai_compatible_client({"llm_provider": "openrouter"}, http_client=pool)
+    finally:
+        pool.close()
+    assert first.kwargs['http_client'] is pool
+    assert second.kwargs['http_client'] is pool
+
+def test_build_openai_client_ssl_context_cached_and_missing_bundle_skipped(monkeypatch):
+    certifi = pytest.importorskip('certifi')
+
+    class KwargsOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(lc, 'OpenAI', KwargsOpenAI)
+    monkeypatch.setenv('OPENROUTER_API_KEY', 'or-key')
+    monkeypatch.delenv('REQUESTS_CA_BUNDLE', raising=False)
+    monkeypatch.delenv('CURL_CA_BUNDLE', raising=False)
+    config = {"llm_provider": "openrouter", "ssl_cert_bundle": certifi.where()}
+    lc._ssl_context.cache_clear()
+    lc.build_openai_compatible_client(config, timeout=10)
+    lc.build_openai_compatible_client(config, timeout=20)
+    info = lc._ssl_context.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+    missing, _ = lc.build_openai_compatible_client(
+        {"llm_provider": "openrouter", "ssl_cert_bundle": "/path/that/does/not/exist.pem"}
+    )
+    assert 'http_client' not in missing.kwargs
+
+
+def test_build_openai_client_shared_between_purposes(monkeypatch):
+    class KwargsOpenAI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(lc, 'OpenAI', KwargsOpenAI)
+    monkeypatch.setenv('OPENROUTER_API_KEY', 'or-key')
+    config = {"llm_provider": "openrouter", "ssl_verify": False}
+    chat, chat_hint = lc.build_openai_compatible_client(config, purpose='chat', timeout=30)
+    embed, embed_hint = lc.build_openai_compatible_client(config, purpose='embeddings', timeout=30)
+    assert chat is embed
+    assert chat_hint is None
+    assert embed_hint == lc.DEFAULT_EMBEDDING_MODEL['openrouter']
+
+    other, _ = lc.build_openai_compatible_client(config, purpose='chat', timeout=60)
+    assert other is not chat
+
+
+def test_build_openai_client_race_closes_losing_client(monkeypatch):
+    built = []
+
+    class RacingOpenAI:
+        def __init__(self, **kwargs):
+            self.closed = False
+            built.append(self)
+            if len(built) == 1:
+                # Another thread builds and caches a client for the same settings meanwhile
+                lc.build_openai_compatible_client(config, timeout=30)
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(lc, 'OpenAI', RacingOpenAI)
+    monkeypatch.setenv('OPENROUTER_API_KEY', 'or-key')
+    config = {"llm_provider": "openrouter", "ssl_verify": False}
+    client, _ = lc.build_openai_compatible_client(config, timeout=30)
+    loser, winner = built
+    assert client is winner
+    assert loser.closed and not winner.closed
@@ -9,6 +9,7 @@ class DummyOpenAI:
 @pytest.fixture(autouse=True)
 def patch_openai(monkeypatch):
     monkeypatch.setattr(lc, 'OpenAI', DummyOpenAI)
+    monkeypatch.setattr(lc, '_CLIENT_CACHE', {})
 
 
 def test_build_client_openrouter_success(monkeypatch):
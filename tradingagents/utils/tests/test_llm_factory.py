@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+import langchain_openai
+from tradingagents.utils import llm_factory
+
+
+class RecordingChat:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def recording_chat(monkeypatch):
+    monkeypatch.setattr(langchain_openai, 'ChatOpenAI', RecordingChat)
+
+
+def test_create_llms_openrouter_models_from_config(monkeypatch, recording_chat):
+    monkeypatch.setenv('OPENROUTER_API_KEY', 'or-key')
+    config = {
+        "llm_provider": "openrouter",
+        "backend_url": "https://openrouter.ai/api/v1",
+        "deep_think_llm": "deep/model",
+        "quick_think_llm": "quick/model",
+    }
+    deep, quick = llm_factory.create_llms(config)
+    assert deep.kwargs['model'] == 'deep/model'
+    assert quick.kwargs['model'] == 'quick/model'
+    for llm in (deep, quick):
+        assert llm.kwargs['base_url'] == 'https://openrouter.ai/api/v1'
+        assert llm.kwargs['api_key'] == 'or-key'
+        assert llm.kwargs['http_client'] is None
+
+
+def test_create_llms_shares_configured_http_client(recording_chat):
+    config = {
+        "llm_provider": "ollama",
+        "backend_url": "http://localhost:11434/v1",
+        "deep_think_llm": "llama3.1",
+        "quick_think_llm": "llama3.2",
+        "ssl_verify": False,
+        "http_timeout": 30,
+    }
+    deep, quick = llm_factory.create_llms(config)
+    assert deep.kwargs['api_key'] is None
+    assert deep.kwargs['http_client'] is not None
+    assert deep.kwargs['http_client'] is quick.kwargs['http_client']
+    deep.kwargs['http_client'].close()
+
+
+def test_create_llms_missing_key_and_unknown_provider(monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    with pytest.raises(ValueError, match='OPENAI_API_KEY'):
+        llm_factory.create_llms({"llm_provider": "openai", "backend_url": "https://api.openai.com/v1"})
+    with pytest.raises(ValueError, match='Unsupported LLM provider'):
+        llm_factory.create_llms({"llm_provider": "mystery", "backend_url": ""})
+
+
+def test_llm_factory_does_not_import_graph():
+    code = "import sys, tradingagents.utils.llm_factory; print('langgraph' in sys.modules, 'tradingagents.agents' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert out.split() == ['False', 'False']
@@ -66,3 +66,19 @@ def test_create_ssl_context_variants(tmp_path):
 def test_get_certificate_info_returns_keys():
     info = get_certificate_info()
     assert {"certifi_bundle", "env_ca_bundle", "env_curl_bundle", "system_cert_bundles"}.issubset(info)
+
+
+def test_get_ssl_config_memoized_results_are_independent():
+    cfg = {"https_proxy": "https://proxy:8443", "http_timeout": 7}
+    first = get_ssl_config(cfg)
+    first["proxies"]["https"] = "mutated"
+    first["timeout"] = 0
+    second = get_ssl_config(dict(cfg))
+    assert second == {"timeout": 7, "proxies": {"https": "https://proxy:8443"}}
+
+
+def test_get_certificate_info_reads_env_each_call(monkeypatch):
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/first.pem")
+    assert get_certificate_info()["env_ca_bundle"] == "/first.pem"
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/second.pem")
+    assert get_certificate_info()["env_ca_bundle"] == "/second.pem"
@@ -0,0 +1,413 @@
+"""
+TradingAgents Web Application Launcher
+
+Starts the TradingAgents webapp using uvicorn. Exposed as the
+``tradingagents-web`` console script and used by the top-level ``app.py``.
+
+Environment:
+    TA_ENV      "dev" (default) enables auto-reload; "prod" disables the
+                file watcher and runs multiple worker processes.
+    TA_WORKERS  Number of worker processes in prod (default: 2 * CPUs + 1).
+    TA_HOST     Bind address (default: localhost in dev, 0.0.0.0 in prod).
+    TA_PORT     Bind port (default: 8000).
+    TA_MAX_CONC Max concurrent connections/tasks per worker before uvicorn answers
+                503 (default: 100).
+    TA_PRELOAD  "1" makes gunicorn import the app once in the master before forking
+                (default: each worker imports it).
+    TA_LOOP     Event loop override: "asyncio", "uvloop" or a custom loop factory
+                import string ("module:factory"), e.g. an io_uring-backed loop.
+                Not applied under gunicorn, whose UvicornWorker picks the loop
+                itself (a warning is logged).
+    TA_CPU      CPU index to pin the server process to in dev / TA_WORKERS=1 mode
+                (Linux only; default: unpinned).
+    TA_ACCESS_LOG       "1" enables per-request access logging (default: off).
+    TA_ACCESS_LOG_FILE  Rotating access log file (default: access.log).
+
+In prod, the launcher hands off to gunicorn with uvicorn workers when gunicorn
+is installed (process supervision, worker restarts); otherwise it falls back to
+per-worker SO_REUSEPORT listeners (Linux/BSD) or uvicorn's own multi-process
+mode. With TA_WORKERS=1 the server runs in-process and overlaps warm-up work
+with start-up on the same event loop.
+"""
+
+import uvicorn
+import asyncio
+import atexit
+import compileall
+import copy
+import importlib.util
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import shutil
+import signal
+import socket
+import time
+import sys
+
+
+logger = logging.getLogger(__name__)
+
+# Project root (parent of the webapp package), computed once at import
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def _default_loop() -> str:
+    return "uvloop" if sys.platform != "win32" and _has_module("uvloop") else "asyncio"
+
+
+def _configure_startup_logger() -> None:
+    """Give the launcher logger its own stderr handler (uvicorn configures only its own loggers)."""
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _precompile_sources(project_root: str) -> None:
+    """Write up-to-date .pyc files for the app packages before any server process imports them.
+
+    Reloader restarts and freshly forked workers then load cached bytecode instead of
+    re-compiling every module on first import. Bytecode is written for each optimization
+    level a server process will import at: this interpreter's (``-O``) and the one
+    requested through ``PYTHONOPTIMIZE``, which exec'd and spawned children inherit.
+    """
+    levels = {sys.flags.optimize}
+    env_optimize = os.environ.get("PYTHONOPTIMIZE", "")
+    if env_optimize.isdigit():
+        levels.add(min(int(env_optimize), 2))
+    for package in ("webapp", "tradingagents"):
+        compileall.compile_dir(
+            os.path.join(project_root, package), quiet=1, workers=0, optimize=sorted(levels)
+        )
+
+
+def _pin_to_cpu(cpu: int) -> None:
+    """Restrict this process (and children it starts, e.g. the reloader's server) to one CPU.
+
+    The event loop is single-threaded; keeping it on one core avoids cache-cold
+    migrations between wake-ups.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("TA_CPU ignored: CPU affinity is not supported on this platform")
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        logger.warning("TA_CPU ignored: cannot pin to CPU %d: %s", cpu, e)
+
+
+def _queued_access_handler(filename: str) -> logging.Handler:
+    """Build the access log handler: requests enqueue records, a background thread writes them.
+
+    Used as a logging ``dictConfig`` handler factory so every uvicorn process that
+    configures logging (reloader child, pool workers) gets its own listener thread.
+    """
+    file_handler = logging.handlers.RotatingFileHandler(
+        filename, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+    )
+    # QueueHandler merges the message with its args before enqueueing, so the
+    # writer formats only the final line (uvicorn's AccessFormatter needs the raw args)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return logging.handlers.QueueHandler(log_queue)
+
+
+def _access_log_config(filename: str) -> dict:
+    """uvicorn's default logging config with the access handler swapped for the queued file handler."""
+    log_config = copy.deepcopy(uvicorn.config.LOGGING_CONFIG)
+    log_config["handlers"]["access"] = {
+        "()": f"{__name__}._queued_access_handler",
+        "filename": filename,
+    }
+    return log_config
+
+
+def _prewarm() -> None:
+    """Load shared configuration so the first request does not pay for it."""
+    try:
+        from tradingagents.config_loader import load_config
+        load_config()
+    except Exception as e:  # warm-up is best effort; the app reports config errors itself
+        logger.warning("Warm-up skipped: %s", e)
+
+
+class _WarmServer(uvicorn.Server):
+    """uvicorn server that runs warm-up work alongside socket bind and app startup.
+
+    Only usable for a single in-process server (no reloader, no worker pool).
+    """
+
+    async def serve(self, sockets=None):
+        warmup = asyncio.ensure_future(asyncio.to_thread(_prewarm))
+        try:
+            await super().serve(sockets=sockets)
+        finally:
+            warmup.cancel()
+
+
+def _reuseport_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+def _reuseport_worker(config: dict) -> None:
+    sock = _reuseport_socket(config["host"], config["port"], config.get("backlog", 2048))
+    try:
+        uvicorn.Server(uvicorn.Config(**config)).run(sockets=[sock])
+    except KeyboardInterrupt:
+        # uvicorn re-raises Ctrl+C after its graceful shutdown; exit quietly
+        pass
+
+
+def _serve_reuseport_workers(config: dict, workers: int) -> None:
+    """Run `workers` uvicorn processes, each with its own SO_REUSEPORT listener.
+
+    The kernel hashes incoming connections across the per-worker accept queues
+    instead of every worker contending on accept() of one shared socket.
+    """
+    worker_config = {k: v for k, v in config.items() if k not in ("workers", "reload")}
+    ctx = multiprocessing.get_context("spawn")
+
+    def spawn(index: int):
+        proc = ctx.Process(target=_reuseport_worker, args=(worker_config,), name=f"uvicorn-worker-{index}")
+        proc.start()
+        return proc
+
+    procs = [spawn(i) for i in range(workers)]
+    stopping = False
+
+    def forward_sigterm(signum, frame):
+        # A supervisor stops only this process; pass the signal on so workers
+        # shut down gracefully instead of being orphaned
+        nonlocal stopping
+        stopping = True
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+
+    previous_handler = signal.signal(signal.SIGTERM, forward_sigterm)
+    try:
+        while True:
+            for i, proc in enumerate(procs):
+                # A clean exit means the worker hit limit_max_requests; replace it.
+                # Failed workers stay down (a broken bind would fail the same way again).
+                if proc.exitcode == 0 and not stopping:
+                    procs[i] = spawn(i)
+            if not any(proc.is_alive() for proc in procs):
+                break
+            time.sleep(1)
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        # Workers share our process group and shut down on Ctrl+C themselves; give them time
+        for proc in procs:
+            proc.join(timeout=10)
+            if proc.is_alive():
+                proc.terminate()
+
+
+def _exec_gunicorn(config: dict) -> None:
+    """Replace the current process with gunicorn running uvicorn workers."""
+    if os.environ.get("TA_LOOP"):
+        _configure_startup_logger()
+        logger.warning("TA_LOOP ignored: gunicorn's UvicornWorker selects its own event loop")
+    argv = [
+        "gunicorn",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(config["workers"]),
+        "-b", f"{config['host']}:{config['port']}",
+        # UvicornWorker maps these onto backlog / timeout_keep_alive / limit_max_requests
+        # (it has no equivalent for limit_concurrency)
+        "--backlog", str(config["backlog"]),
+        "--keep-alive", str(config["timeout_keep_alive"]),
+        "--max-requests", str(config["limit_max_requests"]),
+    ]
+    # Keep worker heartbeat files on tmpfs so liveness checks never touch disk
+    if os.path.isdir("/dev/shm"):
+        argv += ["--worker-tmp-dir", "/dev/shm"]
+    # Import the app per worker by default: preloading in the master and forking
+    # triggers copy-on-write of the whole (large) app heap on first write.
+    if os.environ.get("TA_PRELOAD") == "1":
+        argv.append("--preload")
+    if config["access_log"]:
+        # UvicornWorker logs through gunicorn's access logger (off unless a file is given)
+        argv += ["--access-logfile", config["log_config"]["handlers"]["access"]["filename"]]
+    argv.append("webapp.main:app")
+    # Cap glibc malloc arenas so worker threads do not fragment memory across
+    # many per-thread arenas; read by glibc at start-up, so set before exec.
+    os.environ.setdefault("MALLOC_ARENA_MAX", "2")
+    sys.stdout.flush()  # exec discards unflushed Python buffers
+    os.execvp("gunicorn", argv)
+
+
+def _exec_uvicorn(config: dict) -> None:
+    """Replace the current process with ``python -m uvicorn`` so the launcher's own
+    imports are not kept alive in the reloader / process-manager parent."""
+    argv = [
+        sys.executable, "-m", "uvicorn", config["app"],
+        "--host", config["host"],
+        "--port", str(config["port"]),
+        "--log-level", config["log_level"],
+        "--access-log" if config["access_log"] else "--no-access-log",
+        "--loop", config["loop"],
+        "--http", config["http"],
+        "--limit-concurrency", str(config["limit_concurrency"]),
+        "--backlog", str(config["backlog"]),
+        "--timeout-keep-alive", str(config["timeout_keep_alive"]),
+    ]
+    if config.get("reload"):
+        argv.append("--reload")
+        for directory in config.get("reload_dirs", []):
+            argv += ["--reload-dir", directory]
+        for pattern in config.get("reload_includes", []):
+            argv += ["--reload-include", pattern]
+        for pattern in config.get("reload_excludes", []):
+            argv += ["--reload-exclude", pattern]
+    else:
+        argv += ["--workers", str(config["workers"])]
+        if "limit_max_requests" in config:
+            argv += ["--limit-max-requests", str(config["limit_max_requests"])]
+    sys.stdout.flush()  # exec discards unflushed Python buffers
+    os.execv(sys.executable, argv)
+
+
+def run():
+    """Start the TradingAgents webapp with uvicorn."""
+
+    # providers_models.yaml and the default ./results directory are resolved
+    # relative to the working directory, so run from the project root.
+    os.chdir(PROJECT_ROOT)
+
+    env = os.environ.get("TA_ENV", "dev").lower()
+    is_prod = env == "prod"
+
+    host = os.environ.get("TA_HOST", "0.0.0.0" if is_prod else "localhost")
+    port = int(os.environ.get("TA_PORT", "8000"))
+
+    # Configuration for uvicorn
+    config = {
+        "app": "webapp.main:app",
+        "host": host,
+        "port": port,
+        "log_level": "info",
+        # Per-request access lines are formatted and written on the event loop
+        # thread; keep them off unless asked for, and then write them from a
+        # background thread.
+        "access_log": os.environ.get("TA_ACCESS_LOG") == "1",
+        # Pin the C-accelerated event loop / HTTP parser instead of letting uvicorn
+        # auto-detect them; fall back to the pure-Python stack when unavailable.
+        "loop": os.environ.get("TA_LOOP") or _default_loop(),
+        "http": "httptools" if _has_module("httptools") else "h11",
+        # Backpressure: shed load with fast 503s instead of queueing unbounded
+        # long-running LLM requests, and keep idle client connections around longer.
+        "limit_concurrency": int(os.environ.get("TA_MAX_CONC", "100")),
+        "backlog": 512,
+        "timeout_keep_alive": 30,
+    }
+    if config["access_log"]:
+        config["log_config"] = _access_log_config(
+            os.path.abspath(os.environ.get("TA_ACCESS_LOG_FILE", "access.log"))
+        )
+    if is_prod:
+        # No file watcher in production; scale out across worker processes instead
+        config["reload"] = False
+        config["workers"] = int(os.environ.get("TA_WORKERS", 2 * (os.cpu_count() or 1) + 1))
+        if config["workers"] > 1:
+            # Recycle workers periodically to bound memory growth; only safe where
+            # a supervisor restarts them (gunicorn / worker pools, not a single process)
+            config["limit_max_requests"] = 10000
+    else:
+        config["reload"] = True  # Enable auto-reload for development
+        # Watch only source trees (not results/, data caches or virtualenvs).
+        # With `watchfiles` installed uvicorn uses kernel file notifications instead of polling.
+        config["reload_dirs"] = [os.path.join(PROJECT_ROOT, "webapp"), os.path.join(PROJECT_ROOT, "tradingagents")]
+        config["reload_includes"] = ["*.py"]
+        config["reload_excludes"] = ["*.pyc", "__pycache__/*", ".git/*", "node_modules/*", "*.log"]
+
+    # Container log shippers should see child process output immediately
+    os.environ.setdefault("PYTHONUNBUFFERED", "1")
+
+    interactive = sys.stdout.isatty()
+    if interactive:
+        print("🚀 Starting TradingAgents WebApp...")
+        print(f"📁 Project root: {PROJECT_ROOT}")
+        print(f"🌐 Server will be available at: http://{host}:{port}")
+        if is_prod:
+            print(f"🏭 Production mode: {config['workers']} worker(s), auto-reload disabled")
+        else:
+            print("🔄 Auto-reload is enabled for development")
+        print("⚠️  Make sure you have set up your .env file with required API keys")
+        print("-" * 60)
+    else:
+        # Under systemd/docker emit one plain record instead of the emoji banner
+        _configure_startup_logger()
+        logger.info("uvicorn starting env=%s host=%s port=%d", env, host, port)
+
+    _precompile_sources(PROJECT_ROOT)
+
+    single_process = is_prod and config["workers"] == 1
+    use_gunicorn = (
+        is_prod
+        and not single_process
+        and sys.platform != "win32"
+        and shutil.which("gunicorn") is not None
+    )
+
+    use_reuseport = is_prod and not single_process and hasattr(socket, "SO_REUSEPORT")
+
+    # Multi-worker modes leave placement to the kernel scheduler
+    if os.environ.get("TA_CPU") and (single_process or not is_prod):
+        _configure_startup_logger()
+        try:
+            cpu = int(os.environ["TA_CPU"])
+        except ValueError:
+            logger.warning("TA_CPU ignored: %r is not a CPU index", os.environ["TA_CPU"])
+        else:
+            _pin_to_cpu(cpu)
+
+    try:
+        if use_gunicorn:
+            _exec_gunicorn(config)
+        if single_process:
+            # Share the server's event loop with warm-up instead of serializing them
+            _WarmServer(uvicorn.Config(**config)).run()
+        elif use_reuseport:
+            _serve_reuseport_workers(config, config["workers"])
+        elif sys.platform != "win32" and "log_config" not in config:
+            # Reloader or uvicorn's worker pool, from a fresh interpreter
+            _exec_uvicorn(config)
+        else:
+            # Windows emulates exec by spawning a child and exiting, which breaks
+            # Ctrl+C; the queued access log config can only be passed in-process.
+            uvicorn.run(**config)
+    except KeyboardInterrupt:
+        if interactive:
+            print("\n👋 Shutting down TradingAgents WebApp...")
+    except Exception as e:
+        if interactive:
+            print(f"❌ Error starting the application: {e}")
+        else:
+            logger.error("Error starting the application: %s", e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
+
@@ -461,7 +461,8 @@ PHASE_SEQUENCE = [
 ]
 
 # Mount the static directory to serve CSS, JS, etc.
-app.mount("/static", StaticFiles(directory="webapp/static"), name="static")
+static_dir = os.path.join(os.path.dirname(__file__), "static")
+app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 # Setup Jinja2 for templating
 template_dir = os.path.join(os.path.dirname(__file__), "templates")